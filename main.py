@@ -1,14 +1,29 @@
+import base64
+import gzip
 import json
 import math
 import os
+import sys
 import traceback
 import webbrowser
-from dataclasses import dataclass
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 import xml.etree.ElementTree as ET
 
 import pygame
 
+from src.ui.text import render_text_cached
+
+try:
+    import orjson
+except ImportError:  # Optional: faster map parsing when available.
+    orjson = None
+
 
 SCREEN_WIDTH = 1536
 SCREEN_HEIGHT = 1024
@@ -81,14 +96,73 @@ AUTO_BLOCK_TILESET_KEYWORDS = (
 TORCH_TILESET_KEYWORDS = ("huoba", "torch")
 RIGHT_TRIM_BLOCK_TILESET_KEYWORDS = ("zhongrushi", "zhizhuluan")
 RIGHT_TRIM_BLOCK_KEEP_RATIO = 0.72
+DRAW_BATCH_CACHE_SIZE = 9
+# Largest total flattened tile-layer area (in pixels), about three default views (~19 MB RGBA).
+# The surfaces are rebuilt in a single frame whenever the zoom changes, so that frame stalls
+# in proportion to this area; bigger maps use per-frame batches instead.
+PRERENDER_MAX_PIXELS = 3 * SCREEN_WIDTH * SCREEN_HEIGHT
+
+_WEATHER_LAYER_CACHE: dict[tuple[int, int], tuple] = {}
+_DUST_SPRITE_CACHE: dict[tuple[int, int], pygame.Surface] = {}
+_MENU_BG_CACHE: dict[tuple[int, int], tuple[pygame.Surface, pygame.Rect]] = {}
+_PANEL_CACHE: dict[tuple[int, int, bool], pygame.Surface] = {}
+
+
+@lru_cache(maxsize=128)
+def _load_image_cached(path_str: str) -> pygame.Surface:
+    return pygame.image.load(path_str).convert_alpha()
 
 
 def load_image(path: Path) -> pygame.Surface:
+    # Shared between callers: treat the result as read-only.
     if not path.exists():
         raise FileNotFoundError(f"Missing asset: {path}")
-    return pygame.image.load(path.as_posix()).convert_alpha()
-
-
+    return _load_image_cached(path.resolve().as_posix())
+
+
+def slice_tile(sheet: pygame.Surface, rect: pygame.Rect) -> pygame.Surface:
+    tile = sheet.subsurface(rect)
+    # Fully opaque tiles drop per-pixel alpha so they blit on SDL's plain copy path.
+    if pygame.mask.from_surface(tile, 254).count() == rect.width * rect.height:
+        return tile.convert()
+    return tile
+
+
+def load_json_file(path: Path) -> dict:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=32)
+def parse_tsx(path: Path, mtime_ns: int) -> ET.Element:
+    # Keyed by mtime so edited tilesets are re-read; callers only read the tree.
+    return ET.parse(path).getroot()
+
+
+def decode_layer_data(layer: dict) -> array:
+    # Raw gids (flip flags included) packed as 4-byte unsigned ints.
+    raw = layer.get("data", [])
+    if layer.get("encoding") != "base64":
+        return array("I", raw)
+    payload = base64.b64decode(str(raw))
+    compression = str(layer.get("compression", "") or "")
+    if compression == "zlib":
+        payload = zlib.decompress(payload)
+    elif compression == "gzip":
+        payload = gzip.decompress(payload)
+    elif compression:
+        print(f"Unsupported layer compression '{compression}' in layer '{layer.get('name', '')}'")
+        return array("I")
+    data = array("I")
+    data.frombytes(payload[: len(payload) - len(payload) % data.itemsize])
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data
+
+
+@lru_cache(maxsize=1)
 def find_first_map_file() -> Path:
     explicit_map1 = MAP_DIR / "image" / "map1.json"
     if explicit_map1.exists():
@@ -112,6 +186,41 @@ def find_first_map_file() -> Path:
     raise FileNotFoundError(f"No Tiled JSON file found under: {MAP_DIR}")
 
 
+@lru_cache(maxsize=None)
+def _asset_index() -> dict[str, list[Path]]:
+    # File name -> paths under MAP_DIR, in the same depth-first order rglob yields.
+    index: dict[str, list[Path]] = {}
+
+    def walk(folder: str) -> None:
+        subdirs: list[str] = []
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        subdirs.append(entry.path)
+                    index.setdefault(entry.name, []).append(Path(entry.path))
+        except OSError:
+            return
+        for sub in subdirs:
+            walk(sub)
+
+    walk(MAP_DIR.resolve().as_posix())
+    return index
+
+
+def _find_indexed_asset(base_dir: Path, name: str) -> Path | None:
+    base_dir = base_dir.resolve()
+    paths = _asset_index().get(name, [])
+    if base_dir.is_relative_to(MAP_DIR.resolve()):
+        local = next((path for path in paths if path.is_relative_to(base_dir)), None)
+    else:
+        local = next(base_dir.rglob(name), None)
+    if local is not None:
+        return local
+    return paths[0] if paths else None
+
+
+@lru_cache(maxsize=256)
 def resolve_source_path(map_file: Path, source: str) -> Path:
     raw = Path(source)
     candidates = [
@@ -124,16 +233,14 @@ def resolve_source_path(map_file: Path, source: str) -> Path:
         if c.exists():
             return c
 
-    by_name = next(map_file.parent.rglob(raw.name), None)
+    by_name = _find_indexed_asset(map_file.parent, raw.name)
     if by_name is not None:
         return by_name
-    by_name_global = next(MAP_DIR.rglob(raw.name), None)
-    if by_name_global is not None:
-        return by_name_global
 
     raise FileNotFoundError(f"Cannot resolve tileset source '{source}'")
 
 
+@lru_cache(maxsize=256)
 def resolve_image_path(base_dir: Path, image_source: str) -> Path:
     raw = Path(image_source)
     candidates = [
@@ -151,12 +258,9 @@ def resolve_image_path(base_dir: Path, image_source: str) -> Path:
         if c.exists():
             return c
 
-    by_name = next(base_dir.rglob(raw.name), None)
+    by_name = _find_indexed_asset(base_dir, raw.name)
     if by_name is not None:
         return by_name
-    by_name_global = next(MAP_DIR.rglob(raw.name), None)
-    if by_name_global is not None:
-        return by_name_global
 
     raise FileNotFoundError(
         f"Cannot resolve local tileset image '{image_source}' from '{base_dir}'"
@@ -165,10 +269,32 @@ def resolve_image_path(base_dir: Path, image_source: str) -> Path:
 
 @dataclass
 class TileLayer:
-    data: list[int]
+    data: array
     width: int
     height: int
     visible: bool
+    # Sorted non-empty columns of each row and their masked gids.
+    row_cols: list[array] = field(default_factory=list)
+    row_gids: list[array] = field(default_factory=list)
+    cell_count: int = 0
+
+    def index_cells(self) -> None:
+        self.row_cols = []
+        self.row_gids = []
+        self.cell_count = 0
+        for row in range(self.height):
+            start = row * self.width
+            cols = array("i")
+            gids = array("I")
+            for col, gid_raw in enumerate(self.data[start:start + self.width]):
+                gid = gid_raw & GID_MASK
+                if gid == 0:
+                    continue
+                cols.append(col)
+                gids.append(gid)
+            self.row_cols.append(cols)
+            self.row_gids.append(gids)
+            self.cell_count += len(cols)
 
 
 @dataclass
@@ -200,8 +326,7 @@ class DisplaySettings:
 class TiledMap:
     def __init__(self, map_path: Path):
         self.map_path = map_path
-        with map_path.open("r", encoding="utf-8") as f:
-            content = json.load(f)
+        content = load_json_file(map_path)
 
         self.map_width = int(content["width"])
         self.map_height = int(content["height"])
@@ -214,6 +339,8 @@ class TiledMap:
         self.layers: list[TileLayer] = []
         self.object_tiles: list[ObjectTile] = []
         self.collision_layers: list[TileLayer] = []
+        # Plain rectangle objects flagged as blocked; bucketed with the sprite colliders.
+        self.blocked_object_rects: list[pygame.Rect] = []
         for layer in content.get("layers", []):
             layer_type = str(layer.get("type", "")).strip().lower()
             if layer_type == "imagelayer":
@@ -242,6 +369,7 @@ class TiledMap:
                 for obj in layer.get("objects", []):
                     gid_raw = int(obj.get("gid", 0))
                     if gid_raw == 0:
+                        self._collect_blocked_object_rect(obj)
                         continue
                     self.object_tiles.append(
                         ObjectTile(
@@ -258,11 +386,12 @@ class TiledMap:
             if layer_type != "tilelayer":
                 continue
             tile_layer = TileLayer(
-                data=list(layer.get("data", [])),
+                data=decode_layer_data(layer),
                 width=int(layer.get("width", self.map_width)),
                 height=int(layer.get("height", self.map_height)),
                 visible=bool(layer.get("visible", True)),
             )
+            tile_layer.index_cells()
             self.layers.append(tile_layer)
             layer_name = str(layer.get("name", "")).strip().lower()
             if layer_name in COLLISION_LAYER_NAMES:
@@ -272,13 +401,63 @@ class TiledMap:
 
         self.tiles: dict[int, pygame.Surface] = {}
         self.scaled_tiles_cache: dict[float, dict[int, pygame.Surface]] = {}
+        # Viewport cell bounds + scale -> tiles with positions relative to the map origin.
+        self._draw_cache: OrderedDict[
+            tuple[int, int, int, int, float],
+            list[tuple[pygame.Surface, int, int]],
+        ] = OrderedDict()
+        self._row_tiles_cache: dict[
+            float,
+            list[list[tuple[array, list[pygame.Surface], list[int]]]],
+        ] = {}
+        # Scale -> prepared (scaled, faded) image per image layer.
+        self._image_layer_cache: dict[float, list[tuple[pygame.Surface, int, int]]] = {}
+        # (gid, width, height, opacity) -> prepared tile object surface.
+        self._object_tile_cache: dict[tuple[int, int, int, float], pygame.Surface] = {}
+        self._object_draw_cache: dict[float, list[tuple[pygame.Surface, int, int]]] = {}
+        # Current scale -> tile layers flattened, in draw order, into surfaces with map-space origins.
+        self._prerender_cache: dict[float, list[tuple[pygame.Surface, int, int]] | None] = {}
+        # Scale -> whether image and tile layers paint every pixel of the map opaquely.
+        self._opaque_cover_cache: dict[float, bool] = {}
         self.blocked_gids: set[int] = set()
         self.right_trim_block_gids: set[int] = set()
         self.blocked_sprite_rects: list[pygame.Rect] = []
-        self.coord_text_cache: dict[str, pygame.Surface] = {}
+        self._blocked_rect_grid: dict[tuple[int, int], list[pygame.Rect]] = {}
+        self.coord_text_cache: dict[tuple[str, tuple[int, int, int]], pygame.Surface] = {}
         self.torch_gids: set[int] = set()
+        # (outer radius, inner radius) -> pre-rasterized (glow, eraser) disc pair.
+        self._glow_sprites: dict[tuple[int, int], tuple[pygame.Surface, pygame.Surface]] = {}
+        self._glow_layer: pygame.Surface | None = None
+        self._glow_layer_key: tuple | None = None
+        self._glow_layer_bounds = pygame.Rect(0, 0, 0, 0)
+        # World-pixel tile origins of visible torches, sorted by y then x.
+        self.torch_positions: list[tuple[int, int]] = []
+        self._torch_ys: list[int] = []
+        self._torch_draw_order: list[int] = []
+        # Row-major map cells: 1 where a collision tile or blocked gid sits.
+        self._blocked_cells = bytearray()
         self._load_tilesets(content.get("tilesets", []))
         self._build_blocked_sprite_rects()
+        self._collect_torch_positions()
+        self._build_blocked_cell_mask()
+
+    def _collect_torch_positions(self) -> None:
+        # Position -> index of its last draw in layer/row/col order; later glows overwrite earlier ones.
+        draw_order: dict[tuple[int, int], int] = {}
+        draws = 0
+        if self.torch_gids:
+            for layer in self.layers:
+                if not layer.visible:
+                    continue
+                for row, cols in enumerate(layer.row_cols):
+                    gids = layer.row_gids[row]
+                    for i, col in enumerate(cols):
+                        if gids[i] in self.torch_gids:
+                            draw_order[(col * self.tile_width, row * self.tile_height)] = draws
+                            draws += 1
+        self.torch_positions = sorted(draw_order, key=lambda pos: (pos[1], pos[0]))
+        self._torch_ys = [y for _, y in self.torch_positions]
+        self._torch_draw_order = [draw_order[pos] for pos in self.torch_positions]
 
     def _load_tilesets(self, tilesets: list[dict]) -> None:
         for ts in tilesets:
@@ -288,8 +467,7 @@ class TiledMap:
                 root: ET.Element | None = None
                 try:
                     tsx_path = resolve_source_path(self.map_path, source)
-                    tree = ET.parse(tsx_path)
-                    root = tree.getroot()
+                    root = parse_tsx(tsx_path, tsx_path.stat().st_mtime_ns)
 
                     tile_w = int(root.attrib.get("tilewidth", self.tile_width))
                     tile_h = int(root.attrib.get("tileheight", self.tile_height))
@@ -325,7 +503,7 @@ class TiledMap:
                         or rect.bottom > sheet.get_height()
                     ):
                         continue
-                    self.tiles[first_gid + local_id] = sheet.subsurface(rect).copy()
+                    self.tiles[first_gid + local_id] = slice_tile(sheet, rect)
                 if root is not None:
                     self._collect_blocked_from_tsx(root, first_gid)
                 self._collect_blocked_by_tileset_name(first_gid, tile_count, ts_name)
@@ -358,7 +536,7 @@ class TiledMap:
                 rect = pygame.Rect(col * tile_w, row * tile_h, tile_w, tile_h)
                 if rect.right > sheet.get_width() or rect.bottom > sheet.get_height():
                     continue
-                self.tiles[first_gid + local_id] = sheet.subsurface(rect).copy()
+                self.tiles[first_gid + local_id] = slice_tile(sheet, rect)
             self._collect_blocked_from_json_tileset(ts, first_gid)
             self._collect_blocked_by_tileset_name(first_gid, tile_count, ts_name)
             self._collect_right_trim_collision_by_tileset_name(first_gid, tile_count, ts_name)
@@ -403,6 +581,19 @@ class TiledMap:
             for local_id in range(tile_count):
                 self.right_trim_block_gids.add(first_gid + local_id)
 
+    def _collect_blocked_object_rect(self, obj: dict) -> None:
+        if obj.get("ellipse") or obj.get("point") or "polygon" in obj or "polyline" in obj:
+            return
+        width = round(float(obj.get("width", 0.0)))
+        height = round(float(obj.get("height", 0.0)))
+        if width <= 0 or height <= 0:
+            return
+        if not self._has_blocked_property(obj.get("properties", [])):
+            return
+        x = round(float(obj.get("x", 0.0)))
+        y = round(float(obj.get("y", 0.0)))
+        self.blocked_object_rects.append(pygame.Rect(x, y, width, height))
+
     def _collect_blocked_from_json_tileset(self, ts: dict, first_gid: int) -> None:
         for tile_info in ts.get("tiles", []):
             local_id = int(tile_info.get("id", -1))
@@ -412,7 +603,7 @@ class TiledMap:
                 self.blocked_gids.add(first_gid + local_id)
 
     def _collect_blocked_from_tsx(self, root: ET.Element, first_gid: int) -> None:
-        for tile_node in root.findall("tile"):
+        for tile_node in root.iterfind("tile"):
             local_id = int(tile_node.attrib.get("id", "-1"))
             if local_id < 0:
                 continue
@@ -450,76 +641,147 @@ class TiledMap:
             return self._property_value_truthy(prop.attrib["value"])
         return False
 
+    def _build_blocked_cell_mask(self) -> None:
+        mask = bytearray(self.map_width * self.map_height)
+        collision_ids = {id(layer) for layer in self.collision_layers}
+        for layer in self.layers:
+            is_collision = id(layer) in collision_ids
+            if not is_collision and not self.blocked_gids:
+                continue
+            if layer.width == self.map_width:
+                for row, cols in enumerate(layer.row_cols[: self.map_height]):
+                    gids = layer.row_gids[row]
+                    base = row * self.map_width
+                    for i, col in enumerate(cols):
+                        if is_collision or gids[i] in self.blocked_gids:
+                            mask[base + col] = 1
+                continue
+            # Mismatched layer width: mirror the flat-index lookup cell by cell.
+            size = len(layer.data)
+            for row in range(self.map_height):
+                for col in range(self.map_width):
+                    idx = row * layer.width + col
+                    if idx < 0 or idx >= size:
+                        continue
+                    gid = layer.data[idx] & GID_MASK
+                    if gid != 0 and (is_collision or gid in self.blocked_gids):
+                        mask[row * self.map_width + col] = 1
+        self._blocked_cells = mask
+
     def is_blocked_cell(self, col: int, row: int) -> bool:
         if col < 0 or row < 0 or col >= self.map_width or row >= self.map_height:
             return True
-        for layer in self.collision_layers:
-            idx = row * layer.width + col
-            if 0 <= idx < len(layer.data) and (layer.data[idx] & GID_MASK) != 0:
-                return True
-        for layer in self.layers:
-            idx = row * layer.width + col
-            if idx < 0 or idx >= len(layer.data):
-                continue
-            gid = layer.data[idx] & GID_MASK
-            if gid in self.blocked_gids:
-                return True
-        return False
+        return self._blocked_cells[row * self.map_width + col] != 0
+
+    def _blocked_sprite_size(self, gid: int) -> tuple[int, int]:
+        tile = self.tiles.get(gid)
+        tile_w = tile.get_width() if tile is not None else self.tile_width
+        tile_h = tile.get_height() if tile is not None else self.tile_height
+        if gid in self.right_trim_block_gids and tile_w > self.tile_width:
+            # Keep left-side body collision, trim right overflow for easier pathing.
+            tile_w = max(self.tile_width, round(tile_w * RIGHT_TRIM_BLOCK_KEEP_RATIO))
+        return tile_w, tile_h
 
     def _build_blocked_sprite_rects(self) -> None:
         rects: list[pygame.Rect] = []
+        sizes: dict[int, tuple[int, int]] = {}
+        blocked_gids = self.blocked_gids
         for layer in self.layers:
-            if not layer.visible:
+            if not layer.visible or layer.cell_count == 0:
                 continue
-            for row in range(layer.height):
-                for col in range(layer.width):
-                    idx = row * layer.width + col
-                    if idx < 0 or idx >= len(layer.data):
-                        continue
-                    gid = layer.data[idx] & GID_MASK
-                    if gid == 0 or gid not in self.blocked_gids:
+            for row, (cols, gids) in enumerate(zip(layer.row_cols, layer.row_gids)):
+                for col, gid in zip(cols, gids):
+                    if gid not in blocked_gids:
                         continue
-                    tile = self.tiles.get(gid)
-                    tile_w = tile.get_width() if tile is not None else self.tile_width
-                    tile_h = tile.get_height() if tile is not None else self.tile_height
-                    if gid in self.right_trim_block_gids and tile_w > self.tile_width:
-                        # Keep left-side body collision, trim right overflow for easier pathing.
-                        tile_w = max(self.tile_width, round(tile_w * RIGHT_TRIM_BLOCK_KEEP_RATIO))
+                    size = sizes.get(gid)
+                    if size is None:
+                        size = sizes[gid] = self._blocked_sprite_size(gid)
+                    tile_w, tile_h = size
                     x = col * self.tile_width
                     y = (row + 1) * self.tile_height - tile_h
                     rects.append(pygame.Rect(x, y, tile_w, tile_h))
         self.blocked_sprite_rects = rects
 
+        # Bucket rects by every tile cell they cover so point queries only
+        # test the few rects overlapping that cell.
+        grid: dict[tuple[int, int], list[pygame.Rect]] = {}
+        for rect in rects + self.blocked_object_rects:
+            for cell_row in range(rect.top // self.tile_height, (rect.bottom - 1) // self.tile_height + 1):
+                for cell_col in range(rect.left // self.tile_width, (rect.right - 1) // self.tile_width + 1):
+                    grid.setdefault((cell_col, cell_row), []).append(rect)
+        self._blocked_rect_grid = grid
+
     def is_blocked_point(self, x: float, y: float) -> bool:
         col = int(x // self.tile_width)
         row = int(y // self.tile_height)
         if self.is_blocked_cell(col, row):
             return True
-        px = round(x)
-        py = round(y)
-        for rect in self.blocked_sprite_rects:
-            if rect.collidepoint(px, py):
-                return True
-        return False
+        return self._hits_blocked_sprite(round(x), round(y))
+
+    def _hits_blocked_sprite(self, px: int, py: int) -> bool:
+        bucket = self._blocked_rect_grid.get((px // self.tile_width, py // self.tile_height))
+        if not bucket:
+            return False
+        # A 1x1 rect overlaps exactly the rects that contain the point, and
+        # collidelist runs the scan in C.
+        return pygame.Rect(px, py, 1, 1).collidelist(bucket) != -1
 
     def can_move_to(self, x: float, y: float, half_w: int, half_h: int) -> bool:
-        sample_points = [
+        sample_points = (
             (x - half_w, y - half_h),
             (x + half_w, y - half_h),
             (x - half_w, y + half_h),
             (x + half_w, y + half_h),
-        ]
+        )
+        tile_w = self.tile_width
+        tile_h = self.tile_height
+        map_w = self.map_width
+        map_h = self.map_height
+        blocked_cells = self._blocked_cells
+        # Cheap cell checks for all corners first, sprite rects only if needed.
         for px, py in sample_points:
-            if self.is_blocked_point(px, py):
+            col = int(px // tile_w)
+            row = int(py // tile_h)
+            if col < 0 or row < 0 or col >= map_w or row >= map_h or blocked_cells[row * map_w + col]:
+                return False
+        if not self._blocked_rect_grid:
+            return True
+        for px, py in sample_points:
+            if self._hits_blocked_sprite(round(px), round(py)):
                 return False
         return True
 
-    def _get_coord_label(self, font: pygame.font.Font, text: str) -> pygame.Surface:
-        cached = self.coord_text_cache.get(text)
+    def slide_move(
+        self,
+        x: float,
+        y: float,
+        step_x: float,
+        step_y: float,
+        half_w: int,
+        half_h: int,
+        foot_offset: int,
+    ) -> tuple[float, float]:
+        # Resolve each axis separately so the player slides along walls.
+        target_x = x + step_x
+        if self.can_move_to(target_x, y + foot_offset, half_w, half_h):
+            x = target_x
+        target_y = y + step_y
+        if self.can_move_to(x, target_y + foot_offset, half_w, half_h):
+            y = target_y
+        return x, y
+
+    def _get_coord_label(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: tuple[int, int, int] = (220, 245, 255),
+    ) -> pygame.Surface:
+        key = (text, color)
+        cached = self.coord_text_cache.get(key)
         if cached is not None:
             return cached
-        label = font.render(text, True, (220, 245, 255))
-        self.coord_text_cache[text] = label
+        label = font.render(text, True, color)
+        self.coord_text_cache[key] = label
         return label
 
     def draw_tile_coordinates(
@@ -534,28 +796,18 @@ class TiledMap:
     ) -> None:
         draw_tile_w = max(1, round(self.tile_width * scale))
         draw_tile_h = max(1, round(self.tile_height * scale))
-        world_view_w = surface.get_width() / scale
-        world_view_h = surface.get_height() / scale
-        start_col = max(0, int(camera_x // self.tile_width))
-        end_col = min(
-            self.map_width - 1,
-            int((camera_x + world_view_w) // self.tile_width) + 1,
-        )
-        start_row = max(0, int(camera_y // self.tile_height))
-        end_row = min(
-            self.map_height - 1,
-            int((camera_y + world_view_h) // self.tile_height) + 1,
-        )
+        start_col, start_row, end_col, end_row = self._visible_cell_range(surface, camera_x, camera_y, scale)
         for row in range(start_row, end_row + 1):
             for col in range(start_col, end_col + 1):
                 x = round((col * self.tile_width - camera_x) * scale + offset_x)
                 y = round((row * self.tile_height - camera_y) * scale + offset_y)
                 rect = pygame.Rect(x, y, draw_tile_w, draw_tile_h)
                 pygame.draw.rect(surface, (80, 125, 170), rect, width=1)
-                label = self._get_coord_label(font, f"{col},{row}")
+                text = f"{col},{row}"
+                label = self._get_coord_label(font, text)
+                shadow = self._get_coord_label(font, text, (18, 24, 28))
                 label_rect = label.get_rect(center=rect.center)
-                shadow_rect = label_rect.move(1, 1)
-                surface.blit(font.render(f"{col},{row}", True, (18, 24, 28)), shadow_rect)
+                surface.blit(shadow, label_rect.move(1, 1))
                 surface.blit(label, label_rect)
 
     def _get_scaled_tiles(self, scale: float) -> dict[int, pygame.Surface]:
@@ -570,27 +822,104 @@ class TiledMap:
             target_h = max(1, round(tile.get_height() * scale))
             if tile.get_width() == target_w and tile.get_height() == target_h:
                 scaled[gid] = tile
+                continue
+            if (
+                tile.get_size() == (self.tile_width, self.tile_height)
+                and target_w % tile.get_width() == 0
+                and target_h % tile.get_height() == 0
+            ):
+                # Grid cells stay seamless under whole-number nearest-neighbour upscales;
+                # larger painted object and image tiles keep smoothscale.
+                resized = pygame.transform.scale(tile, (target_w, target_h))
+            else:
+                resized = pygame.transform.smoothscale(tile, (target_w, target_h))
+            if tile.get_flags() & pygame.SRCALPHA:
+                scaled[gid] = resized.convert_alpha()
             else:
-                scaled[gid] = pygame.transform.smoothscale(tile, (target_w, target_h))
+                scaled[gid] = resized.convert()
 
         self.scaled_tiles_cache[key] = scaled
         return scaled
 
-    def draw(
+    def _get_layer_row_tiles(
+        self,
+        scale: float,
+        tiles_for_draw: dict[int, pygame.Surface],
+    ) -> list[list[tuple[array, list[pygame.Surface], list[int]]]]:
+        # Per visible layer and row: columns, resolved surfaces and heights of
+        # drawable cells, so batch rebuilds skip gid lookups.
+        key = round(scale, 4)
+        cached = self._row_tiles_cache.get(key)
+        if cached is not None:
+            return cached
+        layers: list[list[tuple[array, list[pygame.Surface], list[int]]]] = []
+        for layer in self.layers:
+            if not layer.visible or layer.cell_count == 0:
+                continue
+            rows: list[tuple[array, list[pygame.Surface], list[int]]] = []
+            for cols, gids in zip(layer.row_cols, layer.row_gids):
+                row_cols = array("i")
+                row_tiles: list[pygame.Surface] = []
+                row_heights: list[int] = []
+                for col, gid in zip(cols, gids):
+                    tile = tiles_for_draw.get(gid)
+                    if tile is None:
+                        continue
+                    row_cols.append(col)
+                    row_tiles.append(tile)
+                    row_heights.append(tile.get_height())
+                rows.append((row_cols, row_tiles, row_heights))
+            layers.append(rows)
+        self._row_tiles_cache[key] = layers
+        return layers
+
+    def _get_draw_batch(
+        self,
+        start_col: int,
+        start_row: int,
+        end_col: int,
+        end_row: int,
+        scale: float,
+        tiles_for_draw: dict[int, pygame.Surface],
+    ) -> list[tuple[pygame.Surface, int, int]]:
+        # The map is static, so the tile list only changes when the camera
+        # crosses a cell boundary; reuse it and just shift it per frame.
+        key = (start_col, start_row, end_col, end_row, round(scale, 4))
+        cached = self._draw_cache.get(key)
+        if cached is not None:
+            self._draw_cache.move_to_end(key)
+            return cached
+
+        step_x = self.tile_width * scale
+        step_y = self.tile_height * scale
+        col_xs = [round(col * step_x) for col in range(start_col, end_col + 1)]
+        # Match Tiled rule: tile bottom aligns to grid cell bottom.
+        row_bottoms = [round((row + 1) * step_y) for row in range(start_row, end_row + 1)]
+
+        batch: list[tuple[pygame.Surface, int, int]] = []
+        for layer_rows in self._get_layer_row_tiles(scale, tiles_for_draw):
+            for (cols, tiles, heights), bottom in zip(layer_rows[start_row:end_row + 1], row_bottoms):
+                if not cols:
+                    continue
+                lo = bisect_left(cols, start_col)
+                hi = bisect_right(cols, end_col, lo)
+                for i in range(lo, hi):
+                    batch.append((tiles[i], col_xs[cols[i] - start_col], bottom - heights[i]))
+
+        self._draw_cache[key] = batch
+        if len(self._draw_cache) > DRAW_BATCH_CACHE_SIZE:
+            self._draw_cache.popitem(last=False)
+        return batch
+
+    def _visible_cell_range(
         self,
         surface: pygame.Surface,
         camera_x: float,
         camera_y: float,
-        scale: float = 1.0,
-        offset_x: int = 0,
-        offset_y: int = 0,
-    ) -> None:
-        draw_tile_w = max(1, round(self.tile_width * scale))
-        draw_tile_h = max(1, round(self.tile_height * scale))
-        tiles_for_draw = self.tiles if scale == 1.0 else self._get_scaled_tiles(scale)
+        scale: float,
+    ) -> tuple[int, int, int, int]:
         world_view_w = surface.get_width() / scale
         world_view_h = surface.get_height() / scale
-
         start_col = max(0, int(camera_x // self.tile_width))
         end_col = min(
             self.map_width - 1,
@@ -601,10 +930,38 @@ class TiledMap:
             self.map_height - 1,
             int((camera_y + world_view_h) // self.tile_height) + 1,
         )
+        return start_col, start_row, end_col, end_row
 
-        for image_layer in self.image_layers:
-            if not image_layer.visible:
+    def _get_object_draws(
+        self,
+        scale: float,
+        tiles_for_draw: dict[int, pygame.Surface],
+    ) -> list[tuple[pygame.Surface, int, int]]:
+        # Visible tile objects with their prepared surface and scaled top-left.
+        key = round(scale, 4)
+        cached = self._object_draw_cache.get(key)
+        if cached is not None:
+            return cached
+        draws: list[tuple[pygame.Surface, int, int]] = []
+        for obj in self.object_tiles:
+            if not obj.visible:
+                continue
+            tile = tiles_for_draw.get(obj.gid)
+            if tile is None:
                 continue
+            draw_tile = self._get_object_tile_surface(obj, tile, scale)
+            draws.append((draw_tile, round(obj.x * scale), round(obj.y * scale) - draw_tile.get_height()))
+        self._object_draw_cache[key] = draws
+        return draws
+
+    def _get_image_layer_surfaces(self, scale: float) -> list[tuple[pygame.Surface, int, int]]:
+        # Prepared image per image layer with its scaled top-left.
+        key = round(scale, 4)
+        cached = self._image_layer_cache.get(key)
+        if cached is not None:
+            return cached
+        images: list[tuple[pygame.Surface, int, int]] = []
+        for image_layer in self.image_layers:
             image = image_layer.image
             if scale != 1.0:
                 target_w = max(1, round(image.get_width() * scale))
@@ -613,52 +970,199 @@ class TiledMap:
             if image_layer.opacity < 1.0:
                 image = image.copy()
                 image.set_alpha(round(255 * image_layer.opacity))
-            draw_x = round((image_layer.x - camera_x) * scale + offset_x)
-            draw_y = round((image_layer.y - camera_y) * scale + offset_y)
-            surface.blit(image, (draw_x, draw_y))
+            images.append((image, round(image_layer.x * scale), round(image_layer.y * scale)))
+        self._image_layer_cache[key] = images
+        return images
 
-        for layer in self.layers:
-            if not layer.visible:
-                continue
-            for row in range(start_row, end_row + 1):
-                for col in range(start_col, end_col + 1):
-                    idx = row * layer.width + col
-                    if idx < 0 or idx >= len(layer.data):
-                        continue
-                    gid_raw = layer.data[idx]
-                    if gid_raw == 0:
-                        continue
-                    gid = gid_raw & GID_MASK
-                    tile = tiles_for_draw.get(gid)
-                    if tile is None:
-                        continue
-                    # Match Tiled rule: tile bottom aligns to grid cell bottom.
-                    x = round((col * self.tile_width - camera_x) * scale + offset_x)
-                    y = round(
-                        ((row + 1) * self.tile_height - camera_y) * scale
-                        - tile.get_height()
-                        + offset_y
+    def _get_object_tile_surface(
+        self,
+        obj: ObjectTile,
+        tile: pygame.Surface,
+        scale: float,
+    ) -> pygame.Surface:
+        target_w, target_h = tile.get_size()
+        if obj.width > 0 and obj.height > 0:
+            target_w = max(1, round(obj.width * scale))
+            target_h = max(1, round(obj.height * scale))
+        if (target_w, target_h) == tile.get_size() and obj.opacity >= 1.0:
+            return tile
+        key = (obj.gid, target_w, target_h, obj.opacity)
+        cached = self._object_tile_cache.get(key)
+        if cached is not None:
+            return cached
+        draw_tile = tile
+        if draw_tile.get_size() != (target_w, target_h):
+            draw_tile = pygame.transform.smoothscale(draw_tile, (target_w, target_h))
+        if obj.opacity < 1.0:
+            draw_tile = draw_tile.copy()
+            draw_tile.set_alpha(round(255 * obj.opacity))
+        self._object_tile_cache[key] = draw_tile
+        return draw_tile
+
+    def _get_prerendered_layers(
+        self,
+        scale: float,
+        tiles_for_draw: dict[int, pygame.Surface],
+    ) -> list[tuple[pygame.Surface, int, int]] | None:
+        key = round(scale, 4)
+        if key in self._prerender_cache:
+            return self._prerender_cache[key]
+
+        step_x = self.tile_width * scale
+        step_y = self.tile_height * scale
+        entries: list[tuple[pygame.Surface, int, int]] = []
+        for layer_rows in self._get_layer_row_tiles(scale, tiles_for_draw):
+            for row, (cols, tiles, heights) in enumerate(layer_rows):
+                bottom = round((row + 1) * step_y)
+                for col, tile, height in zip(cols, tiles, heights):
+                    entries.append((tile, round(col * step_x), bottom - height))
+
+        prerendered: list[tuple[pygame.Surface, int, int]] | None = None
+        if entries:
+            runs = self._split_flattenable_runs(entries)
+            # Oversized tiles may overhang the grid, so size each surface to its tiles.
+            bounds = []
+            for run in runs:
+                min_x = min(x for _, x, _ in run)
+                min_y = min(y for _, _, y in run)
+                max_x = max(x + tile.get_width() for tile, x, _ in run)
+                max_y = max(y + tile.get_height() for tile, _, y in run)
+                bounds.append((min_x, min_y, max_x - min_x, max_y - min_y))
+            if sum(width * height for _, _, width, height in bounds) <= PRERENDER_MAX_PIXELS:
+                prerendered = []
+                for run, (min_x, min_y, width, height) in zip(runs, bounds):
+                    layer_surface = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+                    layer_surface.fill((0, 0, 0, 0))
+                    layer_surface.blits(
+                        [(tile, (x - min_x, y - min_y)) for tile, x, y in run],
+                        doreturn=False,
                     )
-                    surface.blit(tile, (x, y))
+                    prerendered.append((layer_surface, min_x, min_y))
+        # The surfaces can total PRERENDER_MAX_PIXELS, so only the current scale is kept.
+        self._prerender_cache.clear()
+        self._prerender_cache[key] = prerendered
+        return prerendered
 
-        for obj in self.object_tiles:
-            if not obj.visible:
-                continue
-            tile = tiles_for_draw.get(obj.gid)
-            if tile is None:
-                continue
-            draw_tile = tile
-            if obj.width > 0 and obj.height > 0:
-                target_w = max(1, round(obj.width * scale))
-                target_h = max(1, round(obj.height * scale))
-                if draw_tile.get_width() != target_w or draw_tile.get_height() != target_h:
-                    draw_tile = pygame.transform.smoothscale(draw_tile, (target_w, target_h))
-            if obj.opacity < 1.0:
-                draw_tile = draw_tile.copy()
-                draw_tile.set_alpha(round(255 * obj.opacity))
-            x = round((obj.x - camera_x) * scale + offset_x)
-            y = round((obj.y - camera_y) * scale - draw_tile.get_height() + offset_y)
-            surface.blit(draw_tile, (x, y))
+    @staticmethod
+    def _split_flattenable_runs(
+        entries: list[tuple[pygame.Surface, int, int]],
+    ) -> list[list[tuple[pygame.Surface, int, int]]]:
+        # Flattening onto a transparent surface matches drawing the tiles onto the frame in
+        # turn, except where a semi-transparent pixel lands on one that is already
+        # semi-transparent: pygame's blend onto a non-opaque destination combines differently.
+        # A tile that would do so starts a new surface, so every run flattens exactly.
+        min_x = min(x for _, x, _ in entries)
+        min_y = min(y for _, _, y in entries)
+        max_x = max(x + tile.get_width() for tile, x, _ in entries)
+        max_y = max(y + tile.get_height() for tile, _, y in entries)
+        tile_masks: dict[int, tuple[pygame.mask.Mask, pygame.mask.Mask | None]] = {}
+        semi_covered = pygame.mask.Mask((max_x - min_x, max_y - min_y))
+        any_semi = False
+        runs: list[list[tuple[pygame.Surface, int, int]]] = [[]]
+        for entry in entries:
+            tile, x, y = entry
+            masks = tile_masks.get(id(tile))
+            if masks is None:
+                opaque = pygame.mask.from_surface(tile, 254)
+                semi = None
+                if tile.get_flags() & pygame.SRCALPHA:
+                    semi = pygame.mask.from_surface(tile, 0)
+                    semi.erase(opaque, (0, 0))
+                    if semi.count() == 0:
+                        semi = None
+                masks = (opaque, semi)
+                tile_masks[id(tile)] = masks
+            opaque, semi = masks
+            offset = (x - min_x, y - min_y)
+            if any_semi:
+                if semi is not None and semi_covered.overlap(semi, offset):
+                    runs.append([])
+                    semi_covered.clear()
+                    any_semi = False
+                else:
+                    semi_covered.erase(opaque, offset)
+            if semi is not None:
+                semi_covered.draw(semi, offset)
+                any_semi = True
+            runs[-1].append(entry)
+        return runs
+
+    def covers_view(self, view_width: int, view_height: int, scale: float = 1.0) -> bool:
+        map_w = math.ceil(self.pixel_width * scale)
+        map_h = math.ceil(self.pixel_height * scale)
+        if map_w < view_width or map_h < view_height:
+            return False
+        key = round(scale, 4)
+        opaque = self._opaque_cover_cache.get(key)
+        if opaque is None:
+            # Union of fully opaque pixels from visible image layers and the tile layers, in map space.
+            coverage = pygame.mask.Mask((map_w, map_h))
+            for image_layer, (image, x, y) in zip(self.image_layers, self._get_image_layer_surfaces(scale)):
+                if image_layer.visible and image_layer.opacity >= 1.0:
+                    coverage.draw(pygame.mask.from_surface(image, 254), (x, y))
+            tiles_for_draw = self.tiles if scale == 1.0 else self._get_scaled_tiles(scale)
+            prerendered = self._get_prerendered_layers(scale, tiles_for_draw)
+            for layer_surface, origin_x, origin_y in prerendered or ():
+                coverage.draw(pygame.mask.from_surface(layer_surface, 254), (origin_x, origin_y))
+            opaque = coverage.count() == map_w * map_h
+            self._opaque_cover_cache[key] = opaque
+        return opaque
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        camera_x: float,
+        camera_y: float,
+        scale: float = 1.0,
+        offset_x: int = 0,
+        offset_y: int = 0,
+    ) -> None:
+        tiles_for_draw = self.tiles if scale == 1.0 else self._get_scaled_tiles(scale)
+        # Every map-space position is pre-scaled to ints, so the camera is the
+        # only value rounded per frame.
+        dx = round(offset_x - camera_x * scale)
+        dy = round(offset_y - camera_y * scale)
+        image_blits = [
+            (image, (x + dx, y + dy))
+            for image_layer, (image, x, y) in zip(self.image_layers, self._get_image_layer_surfaces(scale))
+            if image_layer.visible
+        ]
+        if image_blits:
+            surface.blits(image_blits, doreturn=False)
+
+        prerendered = self._get_prerendered_layers(scale, tiles_for_draw)
+        if prerendered is not None:
+            surface.blits(
+                [(layer_surface, (origin_x + dx, origin_y + dy)) for layer_surface, origin_x, origin_y in prerendered],
+                doreturn=False,
+            )
+        else:
+            start_col, start_row, end_col, end_row = self._visible_cell_range(surface, camera_x, camera_y, scale)
+            batch = self._get_draw_batch(start_col, start_row, end_col, end_row, scale, tiles_for_draw)
+            if batch:
+                surface.blits([(tile, (x + dx, y + dy)) for tile, x, y in batch], doreturn=False)
+
+        object_draws = self._get_object_draws(scale, tiles_for_draw)
+        if object_draws:
+            surface.blits([(draw_tile, (x + dx, y + dy)) for draw_tile, x, y in object_draws], doreturn=False)
+
+    def _get_glow_sprite(self, base_radius: int, inner_radius: int) -> tuple[pygame.Surface, pygame.Surface]:
+        key = (base_radius, inner_radius)
+        sprites = self._glow_sprites.get(key)
+        if sprites is None:
+            half = max(base_radius, inner_radius) + 1
+            glow = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+            pygame.draw.circle(glow, (255, 140, 50, 12), (half, half), base_radius)
+            pygame.draw.circle(glow, (255, 190, 110, 22), (half, half), inner_radius)
+            # Multiplying by the eraser zeroes the disc footprint and keeps everything else,
+            # so eraser-then-add reproduces draw.circle overwriting the layer.
+            eraser = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+            eraser.fill((255, 255, 255, 255))
+            pygame.draw.circle(eraser, (0, 0, 0, 0), (half, half), base_radius)
+            pygame.draw.circle(eraser, (0, 0, 0, 0), (half, half), inner_radius)
+            sprites = (glow, eraser)
+            self._glow_sprites[key] = sprites
+        return sprites
 
     def draw_torch_glow(
         self,
@@ -670,41 +1174,54 @@ class TiledMap:
         offset_y: int = 0,
         time_seconds: float = 0.0,
     ) -> None:
-        if not self.torch_gids:
+        if not self.torch_positions:
             return
-        world_view_w = surface.get_width() / scale
-        world_view_h = surface.get_height() / scale
-        start_col = max(0, int(camera_x // self.tile_width))
-        end_col = min(
-            self.map_width - 1,
-            int((camera_x + world_view_w) // self.tile_width) + 1,
-        )
-        start_row = max(0, int(camera_y // self.tile_height))
-        end_row = min(
-            self.map_height - 1,
-            int((camera_y + world_view_h) // self.tile_height) + 1,
-        )
-        glow_layer = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        start_col, start_row, end_col, end_row = self._visible_cell_range(surface, camera_x, camera_y, scale)
+        lo = bisect_left(self._torch_ys, start_row * self.tile_height)
+        hi = bisect_right(self._torch_ys, end_row * self.tile_height)
+        if lo >= hi:
+            return
+        min_x = start_col * self.tile_width
+        max_x = end_col * self.tile_width
         pulse = 0.94 + 0.06 * (1 + math.sin(time_seconds * 7.3)) * 0.5
         base_radius = round(36 * scale * pulse)
         inner_radius = max(8, round(base_radius * 0.45))
-        for layer in self.layers:
-            if not layer.visible:
+        glow, eraser = self._get_glow_sprite(base_radius, inner_radius)
+        size = glow.get_width()
+        half = size // 2
+        visible: list[tuple[int, int, int]] = []
+        for i in range(lo, hi):
+            tx, ty = self.torch_positions[i]
+            if tx < min_x or tx > max_x:
                 continue
-            for row in range(start_row, end_row + 1):
-                for col in range(start_col, end_col + 1):
-                    idx = row * layer.width + col
-                    if idx < 0 or idx >= len(layer.data):
-                        continue
-                    gid = layer.data[idx] & GID_MASK
-                    if gid not in self.torch_gids:
-                        continue
-                    # Align glow center to the red flame core on the wall torch sprite.
-                    fx = round((col * self.tile_width - camera_x) * scale + offset_x + 34 * scale)
-                    fy = round((row * self.tile_height - camera_y) * scale + offset_y + 44 * scale)
-                    pygame.draw.circle(glow_layer, (255, 140, 50, 12), (fx, fy), base_radius)
-                    pygame.draw.circle(glow_layer, (255, 190, 110, 22), (fx, fy), inner_radius)
-        surface.blit(glow_layer, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            # Align glow center to the red flame core on the wall torch sprite.
+            fx = round((tx - camera_x) * scale + offset_x + 34 * scale)
+            fy = round((ty - camera_y) * scale + offset_y + 44 * scale)
+            visible.append((self._torch_draw_order[i], fx - half, fy - half))
+        if not visible:
+            return
+        visible.sort()
+        dests = [(x, y) for _, x, y in visible]
+        glow_layer = self._glow_layer
+        if glow_layer is None or glow_layer.get_size() != surface.get_size():
+            glow_layer = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+            self._glow_layer = glow_layer
+            self._glow_layer_key = None
+            self._glow_layer_bounds = pygame.Rect(0, 0, 0, 0)
+        layer_key = (base_radius, inner_radius, tuple(dests))
+        if layer_key != self._glow_layer_key:
+            # Only the area under the previous glows needs clearing.
+            glow_layer.fill((0, 0, 0, 0), self._glow_layer_bounds)
+            batch = []
+            for dest in dests:
+                batch.append((eraser, dest, None, pygame.BLEND_RGBA_MULT))
+                batch.append((glow, dest, None, pygame.BLEND_RGBA_ADD))
+            glow_layer.blits(batch, doreturn=False)
+            bounds = pygame.Rect(dests[0], (size, size)).unionall([pygame.Rect(dest, (size, size)) for dest in dests])
+            self._glow_layer_bounds = bounds.clip(glow_layer.get_rect())
+            self._glow_layer_key = layer_key
+        bounds = self._glow_layer_bounds
+        surface.blit(glow_layer, bounds, bounds, special_flags=pygame.BLEND_RGBA_ADD)
 
 
 def get_map_offset(
@@ -746,7 +1263,7 @@ def build_animation(
         row_frames: list[pygame.Surface] = []
         for c in range(cols):
             rect = pygame.Rect(c * frame_w, r * frame_h, frame_w, frame_h)
-            row_frames.append(sheet.subsurface(rect).copy())
+            row_frames.append(sheet.subsurface(rect))
         grid.append(row_frames)
 
     # Common RPG spritesheet layout fallback:
@@ -770,13 +1287,14 @@ def normalize_frames_bottom_center(frames: list[pygame.Surface]) -> list[pygame.
         return []
     max_w = max(frame.get_width() for frame in frames)
     max_h = max(frame.get_height() for frame in frames)
+    # One shared strip; each normalized frame is a view into its slot.
+    strip = pygame.Surface((max_w * len(frames), max_h), pygame.SRCALPHA)
     normalized: list[pygame.Surface] = []
-    for frame in frames:
-        canvas = pygame.Surface((max_w, max_h), pygame.SRCALPHA)
+    for i, frame in enumerate(frames):
         x = (max_w - frame.get_width()) // 2
         y = max_h - frame.get_height()
-        canvas.blit(frame, (x, y))
-        normalized.append(canvas)
+        strip.blit(frame, (i * max_w + x, y))
+        normalized.append(strip.subsurface(pygame.Rect(i * max_w, 0, max_w, max_h)))
     return normalized
 
 
@@ -839,7 +1357,7 @@ def load_frames_from_atlas(sheet: pygame.Surface, atlas_path: Path) -> list[pyga
         if x < 0 or y < 0 or x + src_w > sheet.get_width() or y + src_h > sheet.get_height():
             continue
 
-        frame = sheet.subsurface(pygame.Rect(x, y, src_w, src_h)).copy()
+        frame = sheet.subsurface(pygame.Rect(x, y, src_w, src_h))
         if rotate:
             frame = pygame.transform.rotate(frame, -90)
         frames.append(frame)
@@ -852,15 +1370,35 @@ def apply_player_tone(
     brightness: float,
 ) -> dict[str, list[pygame.Surface]]:
     mul = max(0, min(255, round(255 * brightness)))
-    toned: dict[str, list[pygame.Surface]] = {}
-    for direction, frames in anim.items():
-        toned_frames: list[pygame.Surface] = []
+    # Directions often share frame lists (atlas layouts), so tone each
+    # distinct frame once.
+    unique: dict[int, pygame.Surface] = {}
+    for frames in anim.values():
         for frame in frames:
+            unique.setdefault(id(frame), frame)
+    if not unique:
+        return {direction: [] for direction in anim}
+
+    sources = list(unique.values())
+    w, h = sources[0].get_size()
+    toned_by_id: dict[int, pygame.Surface] = {}
+    if all(frame.get_size() == (w, h) for frame in sources):
+        # One multiply over a packed strip; frames become views into it.
+        strip = pygame.Surface((w * len(sources), h), pygame.SRCALPHA)
+        strip.blits([(frame, (i * w, 0)) for i, frame in enumerate(sources)], doreturn=False)
+        strip.fill((mul, mul, mul, 255), special_flags=pygame.BLEND_RGBA_MULT)
+        for i, frame in enumerate(sources):
+            toned_by_id[id(frame)] = strip.subsurface(pygame.Rect(i * w, 0, w, h))
+    else:
+        for frame in sources:
             toned_frame = frame.copy()
             toned_frame.fill((mul, mul, mul, 255), special_flags=pygame.BLEND_RGBA_MULT)
-            toned_frames.append(toned_frame)
-        toned[direction] = toned_frames
-    return toned
+            toned_by_id[id(frame)] = toned_frame
+
+    return {
+        direction: [toned_by_id[id(frame)] for frame in frames]
+        for direction, frames in anim.items()
+    }
 
 
 def scale_animation(
@@ -870,46 +1408,102 @@ def scale_animation(
     if abs(scale - 1.0) < 1e-4:
         return anim
     scaled_anim: dict[str, list[pygame.Surface]] = {}
+    # Directions may share one frame list; scale each distinct frame once.
+    scaled_by_id: dict[int, pygame.Surface] = {}
     for direction, frames in anim.items():
         out_frames: list[pygame.Surface] = []
         for frame in frames:
-            w = max(1, round(frame.get_width() * scale))
-            h = max(1, round(frame.get_height() * scale))
-            out_frames.append(pygame.transform.scale(frame, (w, h)))
+            scaled = scaled_by_id.get(id(frame))
+            if scaled is None:
+                w = max(1, round(frame.get_width() * scale))
+                h = max(1, round(frame.get_height() * scale))
+                scaled = pygame.transform.scale(frame, (w, h))
+                scaled_by_id[id(frame)] = scaled
+            out_frames.append(scaled)
         scaled_anim[direction] = out_frames
     return scaled_anim
 
 
+def _get_weather_layer(
+    size: tuple[int, int],
+) -> tuple[pygame.Surface, list[tuple[pygame.Surface, int]], list[tuple[pygame.Surface, int, int, float, float, int]]]:
+    cached = _WEATHER_LAYER_CACHE.get(size)
+    if cached is not None:
+        return cached
+    w, h = size
+    weather = pygame.Surface((w, h), pygame.SRCALPHA)
+    # Fog bands: ellipse sprite and its fixed center row.
+    bands: list[tuple[pygame.Surface, int]] = []
+    for i in range(4):
+        band = pygame.Surface((round(w * (0.9 - i * 0.12)), round(h * 0.12)), pygame.SRCALPHA)
+        pygame.draw.ellipse(band, (205, 220, 242, 10), band.get_rect())
+        bands.append((band, round(h * (0.2 + i * 0.19))))
+    # Dust motes: sprite, base position, phase rate/offset and sprite half-size.
+    motes: list[tuple[pygame.Surface, int, int, float, float, int]] = []
+    for i in range(44):
+        r = 1 + (i % 2)
+        a = 10 if i % 3 else 14
+        motes.append(
+            (_get_dust_sprite(r, a), (i * 137) % w, (i * 89) % h, 0.11 + (i % 7) * 0.013, i * 0.91, r + 1)
+        )
+    cached = (weather, bands, motes)
+    _WEATHER_LAYER_CACHE[size] = cached
+    return cached
+
+
+def _get_dust_sprite(radius: int, alpha: int) -> pygame.Surface:
+    key = (radius, alpha)
+    sprite = _DUST_SPRITE_CACHE.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (220, 232, 252, alpha), (radius + 1, radius + 1), radius)
+        _DUST_SPRITE_CACHE[key] = sprite
+    return sprite
+
+
 def draw_weather_effects(
     surface: pygame.Surface,
     time_seconds: float,
 ) -> None:
     # Very light atmospheric layer: moving mist bands and dust motes.
+    # The layer surface and shape sprites are built once per window size;
+    # BLEND_RGBA_MAX reproduces drawing the shapes straight onto the tint,
+    # and since MAX is order-independent the blits are grouped by sprite.
     w, h = surface.get_size()
-    weather = pygame.Surface((w, h), pygame.SRCALPHA)
+    weather, bands, motes = _get_weather_layer((w, h))
     weather.fill(WEATHER_TINT)
+    groups: dict[pygame.Surface, list[tuple[int, int]]] = {}
 
     # Wide fog bands drifting left/right.
-    for i in range(4):
-        y = round(h * (0.2 + i * 0.19))
+    for i, (band, y) in enumerate(bands):
         drift = math.sin(time_seconds * (0.18 + i * 0.07) + i * 1.7)
         x = round(w * (0.5 + drift * 0.12))
-        band_w = round(w * (0.9 - i * 0.12))
-        band_h = round(h * 0.12)
-        rect = pygame.Rect(0, 0, band_w, band_h)
-        rect.center = (x, y)
-        pygame.draw.ellipse(weather, (205, 220, 242, 10), rect)
+        rect = band.get_rect(center=(x, y))
+        groups.setdefault(band, []).append(rect.topleft)
 
     # Subtle floating dust particles.
-    particles = 44
-    for i in range(particles):
-        phase = time_seconds * (0.11 + (i % 7) * 0.013) + i * 0.91
-        px = round((i * 137) % w + math.sin(phase * 1.7) * 18) % w
-        py = round(((i * 89) % h + phase * 11) % h)
-        r = 1 + (i % 2)
-        a = 10 if i % 3 else 14
-        pygame.draw.circle(weather, (220, 232, 252, a), (px, py), r)
-
+    sin = math.sin
+    for sprite, base_x, base_y, rate, offset, half in motes:
+        phase = time_seconds * rate + offset
+        px = round(base_x + sin(phase * 1.7) * 18) % w
+        py = round((base_y + phase * 11) % h)
+        groups.setdefault(sprite, []).append((px - half, py - half))
+
+    if hasattr(weather, "fblits"):
+        # pygame-ce: same flags for every item, so skip the per-item tuples.
+        weather.fblits(
+            [(sprite, dest) for sprite, dests in groups.items() for dest in dests],
+            pygame.BLEND_RGBA_MAX,
+        )
+    else:
+        weather.blits(
+            [
+                (sprite, dest, None, pygame.BLEND_RGBA_MAX)
+                for sprite, dests in groups.items()
+                for dest in dests
+            ],
+            doreturn=False,
+        )
     surface.blit(weather, (0, 0))
 
 
@@ -924,8 +1518,8 @@ def draw_player_step_coordinate(
     coord_x = max(1, coord_x)
     coord_y = max(1, coord_y)
     text = f"坐标: {coord_x}.{coord_y}"
-    shadow = font.render(text, True, (18, 22, 26))
-    label = font.render(text, True, (238, 248, 255))
+    shadow = render_text_cached(font, text, (18, 22, 26))
+    label = render_text_cached(font, text, (238, 248, 255))
     shadow_rect = shadow.get_rect(topleft=(16, 16))
     label_rect = label.get_rect(topleft=(15, 15))
     surface.blit(shadow, shadow_rect)
@@ -943,17 +1537,35 @@ def find_spawn_position_top(
         range(tiled_map.map_width),
         key=lambda col: (abs(col - center_col), col),
     )
+    tile_w = tiled_map.tile_width
+    tile_h = tiled_map.tile_height
+    xs = [col * tile_w + tile_w * 0.5 for col in range(tiled_map.map_width)]
+    corner_cols = [(int((x - half_w) // tile_w), int((x + half_w) // tile_w)) for x in xs]
+    # Corner cells are mask lookups; only survivors pay for sprite-rect tests.
+    blocked = tiled_map.is_blocked_cell
     for row in range(0, tiled_map.map_height):
+        y = row * tile_h + tile_h * 0.5
+        foot_y = y + foot_offset
+        top_row = int((foot_y - half_h) // tile_h)
+        bottom_row = int((foot_y + half_h) // tile_h)
         for col in col_order:
-            x = col * tiled_map.tile_width + tiled_map.tile_width * 0.5
-            y = row * tiled_map.tile_height + tiled_map.tile_height * 0.5
-            if tiled_map.can_move_to(x, y + foot_offset, half_w, half_h):
+            left_col, right_col = corner_cols[col]
+            if (
+                blocked(left_col, top_row)
+                or blocked(right_col, top_row)
+                or blocked(left_col, bottom_row)
+                or blocked(right_col, bottom_row)
+            ):
+                continue
+            x = xs[col]
+            if tiled_map.can_move_to(x, foot_y, half_w, half_h):
                 return x, y
     fallback_x = tiled_map.tile_width * (center_col + 0.5)
     fallback_y = max(half_h + 1, tiled_map.tile_height * 0.5)
     return fallback_x, fallback_y
 
 
+@lru_cache(maxsize=None)
 def load_menu_font(size: int) -> pygame.font.Font:
     for font_path in MENU_FONT_CANDIDATES:
         if font_path.exists():
@@ -964,16 +1576,23 @@ def load_menu_font(size: int) -> pygame.font.Font:
 def draw_menu_background(screen: pygame.Surface) -> pygame.Rect:
     view_w, view_h = screen.get_size()
     screen.fill((0, 0, 0))
+    cached = _MENU_BG_CACHE.get((view_w, view_h))
+    if cached is not None:
+        bg, bg_rect = cached
+        screen.blit(bg, bg_rect)
+        return bg_rect.copy()
     if MENU_BG_PATH.exists():
         raw = pygame.image.load(MENU_BG_PATH.as_posix()).convert()
         scale = min(view_w / raw.get_width(), view_h / raw.get_height())
         draw_w = max(1, round(raw.get_width() * scale))
         draw_h = max(1, round(raw.get_height() * scale))
-        bg = pygame.transform.smoothscale(raw, (draw_w, draw_h))
+        bg = pygame.transform.smoothscale(raw, (draw_w, draw_h)).convert()
         x = (view_w - draw_w) // 2
         y = (view_h - draw_h) // 2
-        screen.blit(bg, (x, y))
-        return pygame.Rect(x, y, draw_w, draw_h)
+        bg_rect = pygame.Rect(x, y, draw_w, draw_h)
+        _MENU_BG_CACHE[(view_w, view_h)] = (bg, bg_rect)
+        screen.blit(bg, bg_rect)
+        return bg_rect.copy()
 
     screen.fill((18, 12, 10))
     return screen.get_rect()
@@ -994,18 +1613,22 @@ def draw_menu_button(
     rect.center = center
 
     if draw_panel:
-        panel = pygame.Surface((button_w, button_h), pygame.SRCALPHA)
-        fill_color = (92, 44, 16, 220) if hovered else (70, 34, 12, 210)
-        edge_color = (201, 140, 70, 240) if hovered else (154, 97, 44, 220)
-        glow_color = (250, 184, 92, 70) if hovered else (180, 120, 50, 40)
-        pygame.draw.rect(panel, fill_color, panel.get_rect(), border_radius=18)
-        pygame.draw.rect(panel, edge_color, panel.get_rect(), width=4, border_radius=18)
-        pygame.draw.rect(panel, glow_color, panel.get_rect().inflate(-12, -12), width=2, border_radius=14)
+        panel_key = (button_w, button_h, hovered)
+        panel = _PANEL_CACHE.get(panel_key)
+        if panel is None:
+            panel = pygame.Surface((button_w, button_h), pygame.SRCALPHA)
+            fill_color = (92, 44, 16, 220) if hovered else (70, 34, 12, 210)
+            edge_color = (201, 140, 70, 240) if hovered else (154, 97, 44, 220)
+            glow_color = (250, 184, 92, 70) if hovered else (180, 120, 50, 40)
+            pygame.draw.rect(panel, fill_color, panel.get_rect(), border_radius=18)
+            pygame.draw.rect(panel, edge_color, panel.get_rect(), width=4, border_radius=18)
+            pygame.draw.rect(panel, glow_color, panel.get_rect().inflate(-12, -12), width=2, border_radius=14)
+            _PANEL_CACHE[panel_key] = panel
         surface.blit(panel, rect.topleft)
 
     font = hover_font if hovered else base_font
-    text_surface = font.render(text, True, (246, 222, 180))
-    text_shadow = font.render(text, True, (28, 15, 6))
+    text_surface = render_text_cached(font, text, (246, 222, 180))
+    text_shadow = render_text_cached(font, text, (28, 15, 6))
     text_rect = text_surface.get_rect(center=(rect.centerx, rect.centery + MENU_TEXT_BASELINE_OFFSET))
     shadow_rect = text_rect.move(2, 2)
     surface.blit(text_shadow, shadow_rect)
@@ -1039,7 +1662,7 @@ def draw_pause_panel(
 
     title_font = load_menu_font(58)
     item_font = load_menu_font(50)
-    title_surface = title_font.render(title, True, (230, 236, 240))
+    title_surface = render_text_cached(title_font, title, (230, 236, 240))
     title_rect = title_surface.get_rect(center=(panel.centerx, panel.top + 84))
     screen.blit(title_surface, title_rect)
 
@@ -1047,7 +1670,7 @@ def draw_pause_panel(
     spacing = 84
     item_rects: list[pygame.Rect] = []
     for idx, text in enumerate(items):
-        label = item_font.render(text, True, (232, 238, 242) if idx == hovered_idx else (208, 214, 220))
+        label = render_text_cached(item_font, text, (232, 238, 242) if idx == hovered_idx else (208, 214, 220))
         label_rect = label.get_rect(center=(panel.centerx, start_y + idx * spacing))
         if idx == hovered_idx:
             hover_rect = label_rect.inflate(56, 26)
@@ -1058,7 +1681,7 @@ def draw_pause_panel(
 
     if footer:
         hint_font = load_menu_font(30)
-        footer_surface = hint_font.render(footer, True, (220, 226, 232))
+        footer_surface = render_text_cached(hint_font, footer, (220, 226, 232))
         footer_rect = footer_surface.get_rect(center=(panel.centerx, panel.bottom - 46))
         screen.blit(footer_surface, footer_rect)
 
@@ -1204,6 +1827,12 @@ def run_login_menu(
     base_font = load_menu_font(46)
     hover_font = load_menu_font(52)
     hint_font = load_menu_font(30)
+    has_custom_bg = MENU_BG_PATH.exists()
+    layout_size: tuple[int, int] | None = None
+    button_centers: list[tuple[int, int]] = []
+    button_rects: list[pygame.Rect] = []
+    button_w = button_h = 0
+    cursor_hovered: bool | None = None
 
     while True:
         clock.tick(FPS)
@@ -1211,29 +1840,30 @@ def run_login_menu(
         mouse_pos = pygame.mouse.get_pos()
         hovered_idx = -1
         view_w, view_h = screen.get_size()
-        has_custom_bg = MENU_BG_PATH.exists()
-        if has_custom_bg:
-            center_x = bg_rect.left + round(bg_rect.width * MENU_TEXT_X_RATIO)
-            y_positions = [
-                bg_rect.top + round(bg_rect.height * ratio)
-                for ratio in MENU_TEXT_Y_RATIOS
-            ]
-            button_w = max(220, round(bg_rect.width * 0.25))
-            button_h = max(60, round(bg_rect.height * 0.09))
-        else:
-            spacing = 146
-            total_h = (len(MENU_ITEMS) - 1) * spacing
-            start_y = view_h // 2 - total_h // 2
-            center_x = view_w // 2
-            y_positions = [start_y + i * spacing for i in range(len(MENU_ITEMS))]
-            button_w = 520
-            button_h = 112
-        button_centers = [(center_x, y) for y in y_positions]
-        button_rects = []
-        for center in button_centers:
-            rect = pygame.Rect(0, 0, button_w, button_h)
-            rect.center = center
-            button_rects.append(rect)
+        if layout_size != (view_w, view_h):
+            layout_size = (view_w, view_h)
+            if has_custom_bg:
+                center_x = bg_rect.left + round(bg_rect.width * MENU_TEXT_X_RATIO)
+                y_positions = [
+                    bg_rect.top + round(bg_rect.height * ratio)
+                    for ratio in MENU_TEXT_Y_RATIOS
+                ]
+                button_w = max(220, round(bg_rect.width * 0.25))
+                button_h = max(60, round(bg_rect.height * 0.09))
+            else:
+                spacing = 146
+                total_h = (len(MENU_ITEMS) - 1) * spacing
+                start_y = view_h // 2 - total_h // 2
+                center_x = view_w // 2
+                y_positions = [start_y + i * spacing for i in range(len(MENU_ITEMS))]
+                button_w = 520
+                button_h = 112
+            button_centers = [(center_x, y) for y in y_positions]
+            button_rects = []
+            for center in button_centers:
+                rect = pygame.Rect(0, 0, button_w, button_h)
+                rect.center = center
+                button_rects.append(rect)
         for i, rect in enumerate(button_rects):
             if rect.collidepoint(mouse_pos):
                 hovered_idx = i
@@ -1267,13 +1897,15 @@ def run_login_menu(
                 draw_panel=not has_custom_bg,
             )
 
-        if hovered_idx >= 0:
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
-        else:
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        if cursor_hovered != (hovered_idx >= 0):
+            cursor_hovered = hovered_idx >= 0
+            if cursor_hovered:
+                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
+            else:
+                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
 
         if hovered_idx == MENU_ITEMS.index("读取进度"):
-            hint = hint_font.render("读取进度功能待接入", True, (250, 228, 190))
+            hint = render_text_cached(hint_font, "读取进度功能待接入", (250, 228, 190))
             hint_rect = hint.get_rect(center=(view_w // 2, view_h - 70))
             screen.blit(hint, hint_rect)
 
@@ -1301,14 +1933,14 @@ def run_name_input_menu(screen: pygame.Surface, clock: pygame.time.Clock) -> str
             screen.blit(overlay, panel)
             pygame.draw.rect(screen, (196, 184, 152), panel, width=2, border_radius=10)
 
-            title = title_font.render("请输入你的名字", True, (238, 224, 188))
+            title = render_text_cached(title_font, "请输入你的名字", (238, 224, 188))
             screen.blit(title, title.get_rect(center=(panel.centerx, panel.top + 58)))
 
             input_box = pygame.Rect(panel.left + 96, panel.top + 108, panel.width - 192, 68)
             pygame.draw.rect(screen, (24, 27, 38), input_box, border_radius=8)
             pygame.draw.rect(screen, (210, 198, 164), input_box, width=2, border_radius=8)
 
-            text_surf = body_font.render(name, True, (244, 240, 226))
+            text_surf = render_text_cached(body_font, name, (244, 240, 226))
             text_rect = text_surf.get_rect(midleft=(input_box.left + 20, input_box.centery))
             if name:
                 screen.blit(text_surf, text_rect)
@@ -1326,10 +1958,10 @@ def run_name_input_menu(screen: pygame.Surface, clock: pygame.time.Clock) -> str
                     2,
                 )
 
-            hint = hint_font.render("Enter确认开始 / Backspace删除 / Esc返回", True, (200, 204, 214))
+            hint = render_text_cached(hint_font, "Enter确认开始 / Backspace删除 / Esc返回", (200, 204, 214))
             screen.blit(hint, hint.get_rect(center=(panel.centerx, panel.bottom - 44)))
             if error_hint:
-                err = hint_font.render(error_hint, True, (232, 104, 104))
+                err = render_text_cached(hint_font, error_hint, (232, 104, 104))
                 screen.blit(err, err.get_rect(center=(panel.centerx, panel.bottom - 84)))
 
             for event in pygame.event.get():
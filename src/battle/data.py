@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerState:
     name: str = "莲心"
     hp: int = 20
@@ -11,7 +12,7 @@ class PlayerState:
     speed: float = 290.0
 
 
-@dataclass
+@dataclass(slots=True)
 class EnemyState:
     name: str = "蜘蛛女孩"
     hp: int = 18
@@ -24,26 +25,79 @@ class EnemyState:
     key_act_done: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class InventoryItem:
     name: str
     count: int
     desc: str
 
 
-@dataclass
+DEFAULT_INVENTORY: tuple[tuple[str, int, str], ...] = (
+    ("甘露", 2, "回复 5 HP"),
+    ("布条", 1, "用于叩心:递布"),
+)
+
+
+def _default_inventory() -> list[InventoryItem]:
+    return [InventoryItem(name, count, desc) for name, count, desc in DEFAULT_INVENTORY]
+
+
+@dataclass(slots=True)
 class BattleRuntime:
     player: PlayerState = field(default_factory=PlayerState)
     enemy: EnemyState = field(default_factory=EnemyState)
-    inventory: list[InventoryItem] = field(
-        default_factory=lambda: [
-            InventoryItem("甘露", 2, "回复 5 HP"),
-            InventoryItem("布条", 1, "用于叩心:递布"),
-        ]
-    )
+    inventory: list[InventoryItem] = field(default_factory=_default_inventory)
+    inventory_by_name: dict[str, InventoryItem] = field(default_factory=dict, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.reindex_inventory()
+
+    def reindex_inventory(self) -> None:
+        self.inventory_by_name.clear()
+        for item in self.inventory:
+            self.inventory_by_name.setdefault(item.name, item)
+
+
+BATTLE_RUNTIME_POOL_SIZE = 4
+_battle_runtime_pool: list[BattleRuntime] = []
+
 
+def _reset_defaults(state: PlayerState | EnemyState) -> None:
+    for f in fields(state):
+        setattr(state, f.name, f.default)
 
-@dataclass(frozen=True)
+
+def reset_battle_runtime(runtime: BattleRuntime) -> None:
+    _reset_defaults(runtime.player)
+    _reset_defaults(runtime.enemy)
+    inventory = runtime.inventory
+    if len(inventory) != len(DEFAULT_INVENTORY):
+        inventory[:] = _default_inventory()
+    else:
+        for item, (name, count, desc) in zip(inventory, DEFAULT_INVENTORY):
+            item.name = name
+            item.count = count
+            item.desc = desc
+    runtime.reindex_inventory()
+
+
+def acquire_battle_runtime() -> BattleRuntime:
+    if _battle_runtime_pool:
+        runtime = _battle_runtime_pool.pop()
+        reset_battle_runtime(runtime)
+        return runtime
+    return BattleRuntime()
+
+
+def release_battle_runtime(runtime: BattleRuntime) -> None:
+    if len(_battle_runtime_pool) >= BATTLE_RUNTIME_POOL_SIZE:
+        return
+    if any(pooled is runtime for pooled in _battle_runtime_pool):
+        return
+    _battle_runtime_pool.append(runtime)
+
+
+@dataclass(frozen=True, slots=True)
 class EnemyPressureProfile:
     corner_base_amount: int
     corner_growth: float
@@ -91,11 +145,34 @@ def get_enemy_pressure_profile(enemy_name: str) -> EnemyPressureProfile:
     return ENEMY_PRESSURE_PROFILES.get(enemy_name, DEFAULT_PRESSURE_PROFILE)
 
 
+@dataclass(frozen=True, slots=True)
+class PressureTurn:
+    corner_amount: int
+    top_amount: int
+    size_boost: int
+    speed_scale: float
+
+
+@lru_cache(maxsize=None)
+def get_pressure_turn(profile: EnemyPressureProfile, pressure: int) -> PressureTurn:
+    # Pure function of (profile, pressure); each turn's numbers are computed once.
+    step_turns = max(1, profile.size_boost_step_turns)
+    return PressureTurn(
+        corner_amount=min(
+            profile.corner_cap,
+            round(profile.corner_base_amount * (1.0 + pressure * profile.corner_growth)),
+        ),
+        top_amount=min(
+            profile.top_cap,
+            round(profile.top_base_amount * (1.0 + pressure * profile.top_growth)),
+        ),
+        size_boost=min(profile.size_boost_cap, pressure // step_turns),
+        speed_scale=1.0 + min(profile.speed_growth_cap, pressure * profile.speed_growth),
+    )
+
+
 def get_item(runtime: BattleRuntime, name: str) -> InventoryItem | None:
-    for item in runtime.inventory:
-        if item.name == name:
-            return item
-    return None
+    return runtime.inventory_by_name.get(name)
 
 
 def clamp_enemy_stats(enemy: EnemyState) -> None:
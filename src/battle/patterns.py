@@ -2,99 +2,238 @@ from __future__ import annotations
 
 import math
 import random
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 
 import pygame
 
 
-@dataclass
-class Bullet:
-    pos: pygame.Vector2
-    vel: pygame.Vector2
-    radius: int
-    damage: int
-    color: tuple[int, int, int]
-
-    @property
-    def rect(self) -> pygame.Rect:
-        size = self.radius * 2
-        return pygame.Rect(int(self.pos.x - self.radius), int(self.pos.y - self.radius), size, size)
-
-
-def spawn_corner_drops(box: pygame.Rect, amount: int = 32) -> list[Bullet]:
+# (color, radius) -> filled disc sprite and its offset from the circle center.
+_CIRCLE_SPRITES: dict[tuple[tuple[int, int, int], int], tuple[pygame.Surface, int, int] | None] = {}
+
+
+@dataclass(slots=True)
+class BulletSwarm:
+    # Struct-of-arrays bullet storage: index i across every column is one bullet.
+    pos_x: array = field(default_factory=lambda: array("d"))
+    pos_y: array = field(default_factory=lambda: array("d"))
+    vel_x: array = field(default_factory=lambda: array("d"))
+    vel_y: array = field(default_factory=lambda: array("d"))
+    radius: array = field(default_factory=lambda: array("i"))
+    damage: array = field(default_factory=lambda: array("i"))
+    color: list[tuple[int, int, int]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.pos_x)
+
+    def add(
+        self,
+        x: float,
+        y: float,
+        vx: float,
+        vy: float,
+        radius: int,
+        damage: int,
+        color: tuple[int, int, int],
+    ) -> None:
+        self.pos_x.append(x)
+        self.pos_y.append(y)
+        self.vel_x.append(vx)
+        self.vel_y.append(vy)
+        self.radius.append(radius)
+        self.damage.append(damage)
+        self.color.append(color)
+
+    def extend(self, other: BulletSwarm) -> None:
+        self.pos_x.extend(other.pos_x)
+        self.pos_y.extend(other.pos_y)
+        self.vel_x.extend(other.vel_x)
+        self.vel_y.extend(other.vel_y)
+        self.radius.extend(other.radius)
+        self.damage.extend(other.damage)
+        self.color.extend(other.color)
+
+    def truncate(self, count: int) -> None:
+        del self.pos_x[count:]
+        del self.pos_y[count:]
+        del self.vel_x[count:]
+        del self.vel_y[count:]
+        del self.radius[count:]
+        del self.damage[count:]
+        del self.color[count:]
+
+    def clear(self) -> None:
+        self.truncate(0)
+
+
+def spawn_corner_drops(box: pygame.Rect, amount: int = 32, bullets: BulletSwarm | None = None) -> BulletSwarm:
     corners = [
-        pygame.Vector2(box.left + 8, box.top + 8),
-        pygame.Vector2(box.right - 8, box.top + 8),
-        pygame.Vector2(box.left + 8, box.bottom - 8),
-        pygame.Vector2(box.right - 8, box.bottom - 8),
+        (box.left + 8, box.top + 8),
+        (box.right - 8, box.top + 8),
+        (box.left + 8, box.bottom - 8),
+        (box.right - 8, box.bottom - 8),
     ]
-    bullets: list[Bullet] = []
+    # random.uniform(a, b) is a + (b - a) * random(); inline it with the
+    # bounds hoisted so each draw is a single C call.
+    rand = random.random
+    target_x0 = box.centerx - box.width * 0.25
+    target_x_span = (box.centerx + box.width * 0.25) - target_x0
+    target_y0 = box.centery - box.height * 0.12
+    target_y_span = (box.bottom - 24) - target_y0
+    if bullets is None:
+        bullets = BulletSwarm()
     for i in range(amount):
-        c = corners[i % len(corners)]
+        cx, cy = corners[i % len(corners)]
 
         # Aim toward a moving focus region near the center to increase pressure.
-        target_x = random.uniform(box.centerx - box.width * 0.25, box.centerx + box.width * 0.25)
-        target_y = random.uniform(box.centery - box.height * 0.12, box.bottom - 24)
-        direction = pygame.Vector2(target_x - c.x, target_y - c.y)
-        if direction.length_squared() == 0:
-            direction = pygame.Vector2(0, 1)
-        direction = direction.normalize()
-
-        speed = random.uniform(165, 245)
-        drift = pygame.Vector2(random.uniform(-22, 22), random.uniform(-14, 14))
-        vel = direction * speed + drift
-
-        bullets.append(
-            Bullet(
-                pos=pygame.Vector2(c.x + random.uniform(-16, 16), c.y + random.uniform(-12, 12)),
-                vel=vel,
-                radius=6,
-                damage=2,
-                color=(255, 120, 120),
-            )
+        target_x = target_x0 + target_x_span * rand()
+        target_y = target_y0 + target_y_span * rand()
+        dir_x = target_x - cx
+        dir_y = target_y - cy
+        length = math.sqrt(dir_x * dir_x + dir_y * dir_y)
+        if length == 0:
+            dir_x, dir_y = 0.0, 1.0
+        else:
+            dir_x /= length
+            dir_y /= length
+
+        speed = 165 + 80 * rand()
+        drift_x = -22 + 44 * rand()
+        drift_y = -14 + 28 * rand()
+
+        bullets.add(
+            cx + (-16 + 32 * rand()),
+            cy + (-12 + 24 * rand()),
+            dir_x * speed + drift_x,
+            dir_y * speed + drift_y,
+            radius=6,
+            damage=2,
+            color=(255, 120, 120),
         )
     return bullets
 
 
-def spawn_top_threads(box: pygame.Rect, amount: int = 38) -> list[Bullet]:
-    bullets: list[Bullet] = []
+def spawn_top_threads(box: pygame.Rect, amount: int = 38, bullets: BulletSwarm | None = None) -> BulletSwarm:
+    rand = random.random
+    x0 = box.left + 12
+    x_span = (box.right - 12) - x0
+    y0 = box.top + 2
+    y_span = (box.top + 28) - y0
+    if bullets is None:
+        bullets = BulletSwarm()
     for _ in range(amount):
-        x = random.uniform(box.left + 12, box.right - 12)
-        y = random.uniform(box.top + 2, box.top + 28)
-        speed = random.uniform(220, 320)
-        bullets.append(
-            Bullet(
-                pos=pygame.Vector2(x, y),
-                vel=pygame.Vector2(random.uniform(-48, 48), speed),
-                radius=5,
-                damage=2,
-                color=(120, 180, 255),
-            )
+        x = x0 + x_span * rand()
+        y = y0 + y_span * rand()
+        speed = 220 + 100 * rand()
+        bullets.add(
+            x,
+            y,
+            -48 + 96 * rand(),
+            speed,
+            radius=5,
+            damage=2,
+            color=(120, 180, 255),
         )
     return bullets
 
 
+def boost_bullets(bullets: BulletSwarm, size_boost: int, speed_scale: float, max_radius: int = 14) -> None:
+    radius = bullets.radius
+    vel_x = bullets.vel_x
+    vel_y = bullets.vel_y
+    for i in range(len(bullets)):
+        radius[i] = min(max_radius, radius[i] + size_boost)
+        vel_x[i] *= speed_scale
+        vel_y[i] *= speed_scale
+
+
+def _collision_bounds(rect: pygame.Rect) -> tuple[float, float, float, float]:
+    # Empty rects never collide in Rect.colliderect; inverted bounds fail every overlap test.
+    if rect.width <= 0 or rect.height <= 0:
+        return math.inf, math.inf, -math.inf, -math.inf
+    return rect.left, rect.top, rect.right, rect.bottom
+
+
 def update_bullets(
-    bullets: list[Bullet],
+    bullets: BulletSwarm,
     dt: float,
     box: pygame.Rect,
     player_rect: pygame.Rect,
 ) -> tuple[int, int]:
+    pos_x = bullets.pos_x
+    pos_y = bullets.pos_y
+    vel_x = bullets.vel_x
+    vel_y = bullets.vel_y
+    radius = bullets.radius
+    damage_col = bullets.damage
+    color = bullets.color
+    keep_left, keep_top, keep_right, keep_bottom = _collision_bounds(box.inflate(30, 30))
+    hit_left, hit_top, hit_right, hit_bottom = _collision_bounds(player_rect)
+
     damage = 0
     hit_count = 0
-    alive: list[Bullet] = []
-    for bullet in bullets:
-        bullet.pos += bullet.vel * dt
-        if bullet.rect.colliderect(player_rect):
-            damage += bullet.damage
+    alive = 0
+    # Integrate, test and compact in place; survivors shift down to index `alive`.
+    # Writing at or behind the read position keeps the zip iterators valid.
+    for i, (px, py, vx, vy, r) in enumerate(zip(pos_x, pos_y, vel_x, vel_y, radius)):
+        if r <= 0:
+            continue
+        x = px + vx * dt
+        y = py + vy * dt
+        left = int(x - r)
+        top = int(y - r)
+        right = left + r * 2
+        bottom = top + r * 2
+        if left < hit_right and hit_left < right and top < hit_bottom and hit_top < bottom:
+            damage += damage_col[i]
             hit_count += 1
             continue
-        if box.inflate(30, 30).colliderect(bullet.rect):
-            alive.append(bullet)
-    bullets[:] = alive
+        if left < keep_right and keep_left < right and top < keep_bottom and keep_top < bottom:
+            pos_x[alive] = x
+            pos_y[alive] = y
+            if alive != i:
+                vel_x[alive] = vx
+                vel_y[alive] = vy
+                radius[alive] = r
+                damage_col[alive] = damage_col[i]
+                color[alive] = color[i]
+            alive += 1
+    bullets.truncate(alive)
     return damage, hit_count
 
 
-def draw_bullets(surface: pygame.Surface, bullets: list[Bullet]) -> None:
-    for bullet in bullets:
-        pygame.draw.circle(surface, bullet.color, (int(bullet.pos.x), int(bullet.pos.y)), bullet.radius)
+def _get_circle_sprite(color: tuple[int, int, int], radius: int) -> tuple[pygame.Surface, int, int] | None:
+    key = (color, radius)
+    if key in _CIRCLE_SPRITES:
+        return _CIRCLE_SPRITES[key]
+    # Rasterize once with draw.circle and keep only the touched pixels, so a
+    # blit at center + offset lands on exactly the pixels draw.circle would.
+    size = radius * 2 + 2
+    canvas = pygame.Surface((size, size), pygame.SRCALPHA)
+    bounds = pygame.draw.circle(canvas, color, (radius + 1, radius + 1), radius)
+    sprite = None
+    if bounds.width > 0 and bounds.height > 0:
+        image = canvas.subsurface(bounds)
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        sprite = (image, bounds.x - radius - 1, bounds.y - radius - 1)
+    _CIRCLE_SPRITES[key] = sprite
+    return sprite
+
+
+def draw_bullets(surface: pygame.Surface, bullets: BulletSwarm) -> None:
+    # pygame.draw has no batched circle call; blit cached discs in one batch instead.
+    blit_seq: list[tuple[pygame.Surface, tuple[int, int]]] = []
+    for x, y, r, color in zip(bullets.pos_x, bullets.pos_y, bullets.radius, bullets.color):
+        sprite = _CIRCLE_SPRITES.get((color, r)) or _get_circle_sprite(color, r)
+        if sprite is None:
+            continue
+        image, off_x, off_y = sprite
+        blit_seq.append((image, (int(x) + off_x, int(y) + off_y)))
+    if not blit_seq:
+        return
+    if hasattr(surface, "fblits"):
+        # pygame-ce: plain alpha blits with no per-item flags or return rects.
+        surface.fblits(blit_seq)
+    else:
+        surface.blits(blit_seq, doreturn=False)
@@ -1,14 +1,32 @@
 from __future__ import annotations
 
 import json
+import math
 import random
 from enum import Enum, auto
+from functools import lru_cache
 from pathlib import Path
 
 import pygame
-
-from src.battle.data import BattleRuntime, clamp_enemy_stats, get_enemy_pressure_profile, get_item, refresh_spare_progress
-from src.battle.patterns import Bullet, draw_bullets, spawn_corner_drops, spawn_top_threads, update_bullets
+from pygame.locals import K_DOWN, K_LEFT, K_RIGHT, K_UP, K_a, K_d, K_s, K_w
+
+from src.battle.data import (
+    acquire_battle_runtime,
+    clamp_enemy_stats,
+    get_enemy_pressure_profile,
+    get_item,
+    get_pressure_turn,
+    refresh_spare_progress,
+    release_battle_runtime,
+)
+from src.battle.patterns import (
+    BulletSwarm,
+    boost_bullets,
+    draw_bullets,
+    spawn_corner_drops,
+    spawn_top_threads,
+    update_bullets,
+)
 from src.constants import (
     AVATAR_FRAME,
     AVATAR_IMAGE,
@@ -26,12 +44,114 @@ HIT_SOUND_CANDIDATES = (
     Path(__file__).resolve().parent.parent.parent / "assets" / "sonund2.wav",
     Path(__file__).resolve().parent.parent.parent / "assets" / "sound2" / "shang.WAV",
 )
+# Present unchanged menu/feedback frames with display.update() on just the
+# animated enemy region; set False to always flip() the whole frame.
+BATTLE_PARTIAL_UPDATES = True
+# Window events after which the whole frame must be presented again.
+_FULL_PRESENT_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWSIZECHANGED, pygame.WINDOWRESTORED)
 HIT_EFFECT_JSON_CANDIDATES = (
     Path(__file__).resolve().parent.parent.parent / "assets" / "attack" / "shousheng.json",
     Path(__file__).resolve().parent.parent.parent / "assets" / "attack" / "shoushang.json",
 )
 
 
+# Battle assets are loaded once per process and shared by every BattleScene;
+# callers treat the returned surfaces and sounds as read-only.
+@lru_cache(maxsize=None)
+def _load_font_cached(size: int) -> pygame.font.Font:
+    for path in FONT_CANDIDATES:
+        if path.exists():
+            return pygame.font.Font(path.as_posix(), size)
+    return pygame.font.Font(None, size)
+
+
+@lru_cache(maxsize=None)
+def _load_image_cached(path_str: str, alpha: bool) -> pygame.Surface | None:
+    # Missing files are cached too, so each path is stat'ed once per process.
+    if not Path(path_str).exists():
+        return None
+    surf = pygame.image.load(path_str)
+    return surf.convert_alpha() if alpha else surf.convert()
+
+
+@lru_cache(maxsize=None)
+def _half_size_cached(surface: pygame.Surface) -> pygame.Surface:
+    # Keyed by identity: pass surfaces that come from the cached loaders.
+    half = pygame.transform.smoothscale(
+        surface,
+        (max(1, surface.get_width() // 2), max(1, surface.get_height() // 2)),
+    )
+    return half.convert_alpha()
+
+
+@lru_cache(maxsize=1)
+def _load_enemy_image_cached() -> pygame.Surface:
+    for path in ENEMY_IMAGE_CANDIDATES:
+        if path.exists():
+            img = pygame.image.load(path.as_posix()).convert_alpha()
+            return img
+    raise FileNotFoundError("Missing enemy image: 蛛蜘女孩.png/蜘蛛女孩.png")
+
+
+@lru_cache(maxsize=1)
+def _load_hit_sound_cached() -> pygame.mixer.Sound | None:
+    for path in HIT_SOUND_CANDIDATES:
+        if not path.exists():
+            continue
+        try:
+            return pygame.mixer.Sound(path.as_posix())
+        except Exception:
+            continue
+    return None
+
+
+@lru_cache(maxsize=1)
+def _load_hit_effect_frames_cached() -> tuple[pygame.Surface, ...]:
+    for json_path in HIT_EFFECT_JSON_CANDIDATES:
+        if not json_path.exists():
+            continue
+        try:
+            with json_path.open("r", encoding="utf-8") as f:
+                content = json.load(f)
+            frames = content.get("frames", {})
+            meta = content.get("meta", {})
+            png_name = meta.get("image") or f"{json_path.stem}.png"
+            png_path = json_path.with_name(png_name)
+            if not png_path.exists():
+                png_path = json_path.with_suffix(".png")
+            if not png_path.exists():
+                continue
+            sheet = pygame.image.load(png_path.as_posix()).convert_alpha()
+            frame_names = sorted(
+                frames.keys(),
+                key=lambda name: int("".join(ch for ch in name if ch.isdigit()) or "0"),
+            )
+            sequence: list[pygame.Surface] = []
+            for frame_name in frame_names:
+                frame_info = frames.get(frame_name, {})
+                rect_info = frame_info.get("frame", {})
+                x = int(rect_info.get("x", 0))
+                y = int(rect_info.get("y", 0))
+                w = int(rect_info.get("w", 0))
+                h = int(rect_info.get("h", 0))
+                if w <= 0 or h <= 0:
+                    continue
+                frame = sheet.subsurface(pygame.Rect(x, y, w, h))
+                # Drawn at 115% height; resample once here instead of per blit.
+                scale = max(1, int(frame.get_height() * 1.15))
+                sequence.append(
+                    pygame.transform.smoothscale(
+                        frame,
+                        (max(1, int(frame.get_width() * scale / max(1, frame.get_height()))), scale),
+                    )
+                )
+            if sequence:
+                return tuple(sequence)
+        except Exception:
+            continue
+    return ()
+
+
 class BattleState(Enum):
     OBSERVE = auto()
     PLAYER_MENU = auto()
@@ -44,7 +164,7 @@ class BattleScene:
     def __init__(self, screen: pygame.Surface, clock: pygame.time.Clock, player_hp: int, player_max_hp: int, player_name: str = "莲心") -> None:
         self.screen = screen
         self.clock = clock
-        self.runtime = BattleRuntime()
+        self.runtime = acquire_battle_runtime()
         self.runtime.player.name = player_name.strip() or "莲心"
         self.runtime.player.hp = max(1, min(player_max_hp, player_hp))
         self.runtime.player.max_hp = player_max_hp
@@ -60,11 +180,9 @@ class BattleScene:
         self.bar_bg = self._load_image(HP_BAR_BG)
         self.red_block = self._load_image(RED_BLOCK)
         self.blue_block = self._load_image(BLUE_BLOCK)
-        self.soul = self._load_image(SOUL_IMAGE)
-        self.soul = pygame.transform.smoothscale(
-            self.soul,
-            (max(1, self.soul.get_width() // 2), max(1, self.soul.get_height() // 2)),
-        )
+        self.soul = _half_size_cached(self._load_image(SOUL_IMAGE))
+        self._soul_size = self.soul.get_size()
+        self._soul_half = (self._soul_size[0] // 2, self._soul_size[1] // 2)
 
         self.ui = BattleUI(
             self.background,
@@ -108,7 +226,7 @@ class BattleScene:
         self.attack_duration = 1.55
         self.attack_locked = False
 
-        self.bullets: list[Bullet] = []
+        self.bullets = BulletSwarm()
         self.bullet_timer = 0.0
         self.hit_cooldown = 0.0
         self.hit_sound = self._load_hit_sound()
@@ -125,74 +243,28 @@ class BattleScene:
         self.enemy_hit_shake_amp = 15
 
         self.result: str | None = None
+        # Region touched by the bobbing enemy and hit effect in the last _draw().
+        self._enemy_dirty_rect: pygame.Rect | None = None
+        self._presented_signature: tuple | None = None
+        self._presented_enemy_rect: pygame.Rect | None = None
 
     def _load_font(self, size: int) -> pygame.font.Font:
-        for path in FONT_CANDIDATES:
-            if path.exists():
-                return pygame.font.Font(path.as_posix(), size)
-        return pygame.font.Font(None, size)
+        return _load_font_cached(size)
 
     def _load_image(self, path: Path, alpha: bool = True, required: bool = True) -> pygame.Surface | None:
-        if not path.exists():
-            if required:
-                raise FileNotFoundError(f"Missing battle asset: {path}")
-            return None
-        surf = pygame.image.load(path.as_posix())
-        return surf.convert_alpha() if alpha else surf.convert()
+        surf = _load_image_cached(path.as_posix(), alpha)
+        if surf is None and required:
+            raise FileNotFoundError(f"Missing battle asset: {path}")
+        return surf
 
     def _load_enemy_image(self) -> pygame.Surface:
-        for path in ENEMY_IMAGE_CANDIDATES:
-            if path.exists():
-                img = pygame.image.load(path.as_posix()).convert_alpha()
-                return img
-        raise FileNotFoundError("Missing enemy image: 蛛蜘女孩.png/蜘蛛女孩.png")
+        return _load_enemy_image_cached()
 
     def _load_hit_sound(self) -> pygame.mixer.Sound | None:
-        for path in HIT_SOUND_CANDIDATES:
-            if not path.exists():
-                continue
-            try:
-                return pygame.mixer.Sound(path.as_posix())
-            except Exception:
-                continue
-        return None
+        return _load_hit_sound_cached()
 
     def _load_hit_effect_frames(self) -> list[pygame.Surface]:
-        for json_path in HIT_EFFECT_JSON_CANDIDATES:
-            if not json_path.exists():
-                continue
-            try:
-                with json_path.open("r", encoding="utf-8") as f:
-                    content = json.load(f)
-                frames = content.get("frames", {})
-                meta = content.get("meta", {})
-                png_name = meta.get("image") or f"{json_path.stem}.png"
-                png_path = json_path.with_name(png_name)
-                if not png_path.exists():
-                    png_path = json_path.with_suffix(".png")
-                if not png_path.exists():
-                    continue
-                sheet = pygame.image.load(png_path.as_posix()).convert_alpha()
-                frame_names = sorted(
-                    frames.keys(),
-                    key=lambda name: int("".join(ch for ch in name if ch.isdigit()) or "0"),
-                )
-                sequence: list[pygame.Surface] = []
-                for frame_name in frame_names:
-                    frame_info = frames.get(frame_name, {})
-                    rect_info = frame_info.get("frame", {})
-                    x = int(rect_info.get("x", 0))
-                    y = int(rect_info.get("y", 0))
-                    w = int(rect_info.get("w", 0))
-                    h = int(rect_info.get("h", 0))
-                    if w <= 0 or h <= 0:
-                        continue
-                    sequence.append(sheet.subsurface(pygame.Rect(x, y, w, h)).copy())
-                if sequence:
-                    return sequence
-            except Exception:
-                continue
-        return []
+        return list(_load_hit_effect_frames_cached())
 
     def _play_hit_sound(self) -> None:
         if self.hit_sound is None:
@@ -220,20 +292,34 @@ class BattleScene:
         return (random.randint(-amp, amp), random.randint(-max(1, amp // 2), max(1, amp // 2)))
 
     def _soul_rect(self) -> pygame.Rect:
-        return self.soul.get_rect(center=(int(self.soul_pos.x), int(self.soul_pos.y)))
+        # Same placement as self.soul.get_rect(center=...), without the Surface call.
+        return pygame.Rect(
+            int(self.soul_pos.x) - self._soul_half[0],
+            int(self.soul_pos.y) - self._soul_half[1],
+            self._soul_size[0],
+            self._soul_size[1],
+        )
 
     def run(self) -> dict[str, object]:
+        try:
+            return self._run_loop()
+        finally:
+            release_battle_runtime(self.runtime)
+
+    def _run_loop(self) -> dict[str, object]:
         running = True
         while running:
             dt = self.clock.tick(60) / 1000.0
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     return {"quit": True, "player_hp": self.runtime.player.hp, "monster_defeated": False, "outcome": None}
+                if event.type in _FULL_PRESENT_EVENTS:
+                    self._presented_signature = None
                 self._handle_event(event)
 
             self._update(dt)
             self._draw()
-            pygame.display.flip()
+            self._present()
 
             if self.result is not None:
                 return {
@@ -245,6 +331,50 @@ class BattleScene:
 
         return {"quit": True, "player_hp": self.runtime.player.hp, "monster_defeated": False, "outcome": None}
 
+    def _static_frame_signature(self) -> tuple | None:
+        # Everything besides the enemy's bob/shake/hit effect that _draw() reads in
+        # the states whose frames are otherwise still; None means "always flip".
+        if self.state == BattleState.ENEMY_BULLETS:
+            return None
+        if self.state == BattleState.PLAYER_ACTION and self.list_mode == "attack":
+            return None
+        player = self.runtime.player
+        enemy = self.runtime.enemy
+        return (
+            self.screen.get_size(),
+            self.state,
+            self.list_mode,
+            self.main_selected,
+            self.list_selected,
+            tuple(self.info_lines),
+            tuple(self._active_options()) if self.state == BattleState.PLAYER_ACTION else (),
+            self._soul_rect().topleft,
+            player.name,
+            player.hp,
+            player.max_hp,
+            enemy.hp,
+            enemy.max_hp,
+            enemy.mind,
+            enemy.max_mind,
+            enemy.spare_progress,
+            enemy.key_act_done,
+        )
+
+    def _present(self) -> None:
+        signature = self._static_frame_signature() if BATTLE_PARTIAL_UPDATES else None
+        enemy_rect = self._enemy_dirty_rect
+        if (
+            signature is not None
+            and signature == self._presented_signature
+            and enemy_rect is not None
+            and self._presented_enemy_rect is not None
+        ):
+            pygame.display.update(enemy_rect.union(self._presented_enemy_rect))
+        else:
+            pygame.display.flip()
+        self._presented_signature = signature
+        self._presented_enemy_rect = enemy_rect
+
     def _handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
             if self.state == BattleState.OBSERVE and event.key in (pygame.K_RETURN, pygame.K_SPACE):
@@ -384,30 +514,16 @@ class BattleScene:
         self.bullet_timer = random.uniform(3.5, 4.8)
         self.bullets.clear()
         self.enemy_turn_count += 1
-        pressure = max(0, self.enemy_turn_count - 1)
-        profile = self.pressure_profile
+        turn = get_pressure_turn(self.pressure_profile, max(0, self.enemy_turn_count - 1))
         pattern = random.choice(("corner", "top"))
         if pattern == "corner":
-            amount = min(
-                profile.corner_cap,
-                round(profile.corner_base_amount * (1.0 + pressure * profile.corner_growth)),
-            )
-            self.bullets.extend(spawn_corner_drops(self.battle_box, amount=amount))
+            spawn_corner_drops(self.battle_box, amount=turn.corner_amount, bullets=self.bullets)
             self.info_lines = [f"细丝点从四角落下（第{self.enemy_turn_count}回合）", "回合越久越危险"]
         else:
-            amount = min(
-                profile.top_cap,
-                round(profile.top_base_amount * (1.0 + pressure * profile.top_growth)),
-            )
-            self.bullets.extend(spawn_top_threads(self.battle_box, amount=amount))
+            spawn_top_threads(self.battle_box, amount=turn.top_amount, bullets=self.bullets)
             self.info_lines = [f"洞顶落丝（第{self.enemy_turn_count}回合）", "回合越久越危险"]
 
-        step_turns = max(1, profile.size_boost_step_turns)
-        size_boost = min(profile.size_boost_cap, pressure // step_turns)
-        speed_scale = 1.0 + min(profile.speed_growth_cap, pressure * profile.speed_growth)
-        for bullet in self.bullets:
-            bullet.radius = min(14, bullet.radius + size_boost)
-            bullet.vel *= speed_scale
+        boost_bullets(self.bullets, turn.size_boost, turn.speed_scale)
 
     def _update(self, dt: float) -> None:
         if self.enemy_hit_shake_timer > 0:
@@ -505,12 +621,14 @@ class BattleScene:
 
     def _update_soul_movement(self, dt: float) -> None:
         keys = pygame.key.get_pressed()
-        dx = (keys[pygame.K_d] or keys[pygame.K_RIGHT]) - (keys[pygame.K_a] or keys[pygame.K_LEFT])
-        dy = (keys[pygame.K_s] or keys[pygame.K_DOWN]) - (keys[pygame.K_w] or keys[pygame.K_UP])
-        vec = pygame.Vector2(dx, dy)
-        if vec.length_squared() > 0:
-            vec = vec.normalize() * self.runtime.player.speed * dt
-            self.soul_pos += vec
+        dx = (keys[K_d] | keys[K_RIGHT]) - (keys[K_a] | keys[K_LEFT])
+        dy = (keys[K_s] | keys[K_DOWN]) - (keys[K_w] | keys[K_UP])
+        if dx or dy:
+            # Same per-axis operations as Vector2.normalize() * speed * dt.
+            length = math.sqrt(dx * dx + dy * dy)
+            speed = self.runtime.player.speed
+            self.soul_pos.x += dx / length * speed * dt
+            self.soul_pos.y += dy / length * speed * dt
 
         margin = 22
         top_margin = margin + 24  # Lower upper movement ceiling by roughly one character height.
@@ -525,17 +643,14 @@ class BattleScene:
         if self.enemy_hit_effect_active and self.enemy_hit_effect_frames:
             idx = min(self.enemy_hit_effect_index, len(self.enemy_hit_effect_frames) - 1)
             frame = self.enemy_hit_effect_frames[idx]
-            scale = max(1, int(frame.get_height() * 1.15))
-            frame_scaled = pygame.transform.smoothscale(
-                frame,
-                (max(1, int(frame.get_width() * scale / max(1, frame.get_height()))), scale),
-            )
-            fx = int(enemy_rect.centerx - frame_scaled.get_width() * 0.56)
-            fy = int(enemy_rect.centery - frame_scaled.get_height() * 0.60)
-            self.screen.blit(frame_scaled, (fx, fy))
+            fx = int(enemy_rect.centerx - frame.get_width() * 0.56)
+            fy = int(enemy_rect.centery - frame.get_height() * 0.60)
+            effect_rect = self.screen.blit(frame, (fx, fy))
+            enemy_rect = enemy_rect.union(effect_rect)
+        self._enemy_dirty_rect = enemy_rect
         self.ui.draw_hud(self.screen, self.runtime, self.runtime.player.name, self.battle_box)
 
-        self.ui.draw_battle_box(self.screen, self.battle_box)
+        # The background artwork already contains the battle frame.
         if self.state in (BattleState.ENEMY_BULLETS, BattleState.FEEDBACK, BattleState.PLAYER_MENU):
             self.screen.blit(self.soul, self._soul_rect())
         if self.state == BattleState.ENEMY_BULLETS:
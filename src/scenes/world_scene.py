@@ -1,24 +1,57 @@
 from __future__ import annotations
 
 import csv
+import io
 import json
+import math
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import pygame
+from pygame.locals import K_DOWN, K_LEFT, K_RIGHT, K_UP, K_a, K_d, K_s, K_w
 
 from src.constants import ENEMY_IMAGE_CANDIDATES, FONT_CANDIDATES
 from src.scenes.battle_scene import BattleScene
-
-
-
-
+from src.ui.text import render_text_cached
+
+try:
+    import orjson
+except ImportError:  # Optional: faster map parsing when available.
+    orjson = None
+
+_INV_SQRT2 = math.sqrt(0.5)
+_UNIT_DIRECTIONS: dict[tuple[float, float], tuple[float, float]] = {
+    (-1.0, -1.0): (-_INV_SQRT2, -_INV_SQRT2),
+    (0.0, -1.0): (0.0, -1.0),
+    (1.0, -1.0): (_INV_SQRT2, -_INV_SQRT2),
+    (-1.0, 0.0): (-1.0, 0.0),
+    (1.0, 0.0): (1.0, 0.0),
+    (-1.0, 1.0): (-_INV_SQRT2, _INV_SQRT2),
+    (0.0, 1.0): (0.0, 1.0),
+    (1.0, 1.0): (_INV_SQRT2, _INV_SQRT2),
+}
+
+# Dialogue CSV cell values, matched after strip().lower().
+_PLAYER_SPEAKERS = frozenset({"", "player", "玩家"})
+_DIALOGUE_POSITIONS = {"bottom": "bottom", "down": "bottom", "下": "bottom", "top": "top", "up": "top", "上": "top"}
+_DIALOGUE_TARGETS = {"player": "player", "玩家": "player", "npc": "npc", "enemy": "npc", "对方": "npc"}
+_TRUTHY_FLAGS = frozenset({"1", "true", "yes", "y", "是"})
+
+# Window events after which a static prompt must be drawn again.
+_REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWSIZECHANGED, pygame.WINDOWRESTORED)
+
+
+# Fonts and the monster image are loaded once per process and shared; treat them as read-only.
+@lru_cache(maxsize=32)
 def _load_ui_font(size: int) -> pygame.font.Font:
     for path in FONT_CANDIDATES:
         if path.exists():
             return pygame.font.Font(path.as_posix(), size)
     return pygame.font.Font(None, size)
 
+
+@lru_cache(maxsize=1)
 def _load_monster_image() -> pygame.Surface:
     for path in ENEMY_IMAGE_CANDIDATES:
         if path.exists():
@@ -27,50 +60,81 @@ def _load_monster_image() -> pygame.Surface:
     raise FileNotFoundError("Missing enemy image: 蛛蜘女孩.png/蜘蛛女孩.png")
 
 
+@lru_cache(maxsize=16)
+def _filled_overlay(size: tuple[int, int], rgba: tuple[int, int, int, int]) -> pygame.Surface:
+    # Translucent panel backgrounds are blitted, never drawn on, so one surface per size is reused.
+    overlay = pygame.Surface(size, pygame.SRCALPHA)
+    overlay.fill(rgba)
+    return overlay
+
+
+def _read_json(path: Path) -> dict:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _iter_map_objects(content: dict) -> Iterator[dict[str, Any]]:
+    # Object-group layers are filtered once; tile and image layers are skipped whole.
+    for layer in content.get("layers", ()):
+        if str(layer.get("type", "")).strip().lower() == "objectgroup":
+            yield from layer.get("objects", ())
+
+
+# Keyed by (path, mtime) so an edited map is reparsed; results are shared, treat them as read-only.
+@lru_cache(maxsize=16)
+def _read_map_json(path_str: str, mtime: float) -> dict:
+    return _read_json(Path(path_str))
+
+
 def _load_teleports(map_file: Path) -> list[dict[str, Any]]:
-    with map_file.open("r", encoding="utf-8") as f:
-        content = json.load(f)
+    return _load_teleports_cached(str(map_file), map_file.stat().st_mtime)
+
+
+@lru_cache(maxsize=16)
+def _load_teleports_cached(path_str: str, mtime: float) -> list[dict[str, Any]]:
+    content = _read_map_json(path_str, mtime)
 
     teleports: list[dict[str, Any]] = []
-    for layer in content.get("layers", []):
-        if str(layer.get("type", "")).strip().lower() != "objectgroup":
-            continue
-        for obj in layer.get("objects", []):
-            properties: dict[str, Any] = {}
-            for prop in obj.get("properties", []):
-                name = str(prop.get("name", "")).strip()
-                if not name:
-                    continue
+    for obj in _iter_map_objects(content):
+        properties: dict[str, Any] = {}
+        for prop in obj.get("properties", ()):
+            name = str(prop.get("name", "")).strip()
+            if name:
                 properties[name] = prop.get("value")
 
-            obj_type = str(obj.get("type") or properties.get("type") or "").strip().lower()
-            if obj_type != "teleport":
-                continue
-
-            target_map = str(properties.get("target_map") or "").strip()
-            if not target_map:
-                continue
+        obj_type = str(obj.get("type") or properties.get("type") or "").strip().lower()
+        if obj_type != "teleport":
+            continue
 
-            raw_x = float(obj.get("x", 0.0))
-            raw_y = float(obj.get("y", 0.0))
-            raw_w = float(obj.get("width", 0.0))
-            raw_h = float(obj.get("height", 0.0))
-            width = max(1, round(raw_w))
-            height = max(1, round(raw_h))
-            rect = pygame.Rect(round(raw_x), round(raw_y), width, height)
+        target_map = str(properties.get("target_map") or "").strip()
+        if not target_map:
+            continue
 
-            teleports.append(
-                {
-                    "rect": rect,
-                    "target_map": target_map,
-                    "spawn_x": properties.get("spawn_x"),
-                    "spawn_y": properties.get("spawn_y"),
-                }
-            )
+        raw_x = float(obj.get("x", 0.0))
+        raw_y = float(obj.get("y", 0.0))
+        raw_w = float(obj.get("width", 0.0))
+        raw_h = float(obj.get("height", 0.0))
+        width = max(1, round(raw_w))
+        height = max(1, round(raw_h))
+        rect = pygame.Rect(round(raw_x), round(raw_y), width, height)
+
+        teleports.append(
+            {
+                "rect": rect,
+                "bounds": (rect.left, rect.top, rect.right, rect.bottom),
+                "target_map": target_map,
+                "spawn_x": properties.get("spawn_x"),
+                "spawn_y": properties.get("spawn_y"),
+            }
+        )
 
     return teleports
 
 
+# Map layout is fixed at runtime; failures raise and are not cached, so they retry.
+@lru_cache(maxsize=64)
 def _resolve_target_map_file(current_map_file: Path, target_map: str, map_dir: Path | None) -> Path:
     raw = Path(target_map)
     candidates = [
@@ -131,24 +195,32 @@ def _pick_spawn_position(
 def _show_battle_result_prompt(screen: pygame.Surface, clock: pygame.time.Clock, title: str) -> str:
     title_font = _load_ui_font(92)
     hint_font = _load_ui_font(38)
+    title_shadow = title_font.render(title, True, (16, 16, 16))
+    title_label = title_font.render(title, True, (238, 238, 238))
+    hint = hint_font.render("按回车继续", True, (190, 190, 190))
 
+    drawn_size: tuple[int, int] | None = None
     while True:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return "quit"
             if event.type == pygame.KEYDOWN and event.key in (pygame.K_RETURN, pygame.K_SPACE):
                 return "continue"
+            if event.type in _REDRAW_EVENTS:
+                drawn_size = None
 
         w, h = screen.get_size()
+        if drawn_size == (w, h):
+            # Static screen: nothing to present until it is exposed or resized.
+            clock.tick(60)
+            continue
+        drawn_size = (w, h)
         screen.fill((0, 0, 0))
 
-        title_shadow = title_font.render(title, True, (16, 16, 16))
-        title_label = title_font.render(title, True, (238, 238, 238))
         title_rect = title_label.get_rect(center=(w // 2, h // 2 - 36))
         screen.blit(title_shadow, title_rect.move(3, 3))
         screen.blit(title_label, title_rect)
 
-        hint = hint_font.render("按回车继续", True, (190, 190, 190))
         hint_rect = hint.get_rect(center=(w // 2, h // 2 + 64))
         screen.blit(hint, hint_rect)
 
@@ -159,7 +231,7 @@ def _show_battle_result_prompt(screen: pygame.Surface, clock: pygame.time.Clock,
 def _draw_keycap(surface: pygame.Surface, rect: pygame.Rect, label: str, font: pygame.font.Font) -> None:
     pygame.draw.rect(surface, (26, 30, 40), rect, border_radius=8)
     pygame.draw.rect(surface, (188, 196, 214), rect, width=2, border_radius=8)
-    text = font.render(label, True, (236, 240, 248))
+    text = render_text_cached(font, label, (236, 240, 248))
     surface.blit(text, text.get_rect(center=rect.center))
 
 
@@ -169,24 +241,29 @@ def _show_world_tutorial_prompt(screen: pygame.Surface, clock: pygame.time.Clock
     key_font = _load_ui_font(28)
     hint_font = _load_ui_font(28)
 
+    drawn_size: tuple[int, int] | None = None
     while True:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return "quit"
             if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
                 return "continue"
+            if event.type in _REDRAW_EVENTS:
+                drawn_size = None
 
         w, h = screen.get_size()
+        if drawn_size == (w, h):
+            clock.tick(60)
+            continue
+        drawn_size = (w, h)
         screen.fill((0, 0, 0))
 
         panel = pygame.Rect(0, 0, min(1120, max(760, w - 120)), min(620, max(460, h - 120)))
         panel.center = (w // 2, h // 2)
-        overlay = pygame.Surface((panel.width, panel.height), pygame.SRCALPHA)
-        overlay.fill((8, 12, 18, 228))
-        screen.blit(overlay, panel)
+        screen.blit(_filled_overlay(panel.size, (8, 12, 18, 228)), panel)
         pygame.draw.rect(screen, (188, 196, 214), panel, width=2, border_radius=16)
 
-        title = title_font.render("基础操作教学", True, (240, 236, 214))
+        title = render_text_cached(title_font, "基础操作教学", (240, 236, 214))
         screen.blit(title, title.get_rect(center=(panel.centerx, panel.top + 70)))
 
         arrow_box = pygame.Rect(panel.left + 60, panel.top + 140, panel.width // 2 - 90, panel.height - 220)
@@ -211,7 +288,7 @@ def _show_world_tutorial_prompt(screen: pygame.Surface, clock: pygame.time.Clock
         _draw_keycap(screen, down, "S / ↓", key_font)
         _draw_keycap(screen, right, "D / →", key_font)
 
-        move_text = body_font.render("行走移动", True, (226, 232, 244))
+        move_text = render_text_cached(body_font, "行走移动", (226, 232, 244))
         screen.blit(move_text, move_text.get_rect(center=(arrow_box.centerx, arrow_box.top + 42)))
 
         right_box = pygame.Rect(panel.centerx + 16, panel.top + 140, panel.width // 2 - 76, panel.height - 220)
@@ -220,13 +297,13 @@ def _show_world_tutorial_prompt(screen: pygame.Surface, clock: pygame.time.Clock
 
         esc_key = pygame.Rect(right_box.left + 48, right_box.top + 72, 120, 58)
         _draw_keycap(screen, esc_key, "ESC", key_font)
-        esc_text = body_font.render("打开功能菜单", True, (226, 232, 244))
+        esc_text = render_text_cached(body_font, "打开功能菜单", (226, 232, 244))
         screen.blit(esc_text, esc_text.get_rect(midleft=(esc_key.right + 22, esc_key.centery)))
 
-        tip_text = body_font.render("建议先熟悉移动，再探索地图", True, (214, 222, 236))
+        tip_text = render_text_cached(body_font, "建议先熟悉移动，再探索地图", (214, 222, 236))
         screen.blit(tip_text, tip_text.get_rect(midleft=(right_box.left + 48, right_box.top + 188)))
 
-        hint = hint_font.render("按任意键或点击鼠标继续", True, (198, 206, 220))
+        hint = render_text_cached(hint_font, "按任意键或点击鼠标继续", (198, 206, 220))
         screen.blit(hint, hint.get_rect(center=(panel.centerx, panel.bottom - 36)))
 
         pygame.display.flip()
@@ -251,10 +328,10 @@ def _draw_dialogue_overlay(
         lines = [text.strip() or "..."]
     lines = lines[:3]
 
-    title_surface = title_font.render(title, True, (222, 214, 192)) if title.strip() else None
-    line_surfaces = [body_font.render(line, True, (244, 244, 244)) for line in lines]
-    line_shadows = [body_font.render(line, True, (14, 14, 14)) for line in lines]
-    hint_surface = hint_font.render("按任意键继续", True, (198, 198, 198)) if show_hint else None
+    title_surface = render_text_cached(title_font, title, (222, 214, 192)) if title.strip() else None
+    line_surfaces = [render_text_cached(body_font, line, (244, 244, 244)) for line in lines]
+    line_shadows = [render_text_cached(body_font, line, (14, 14, 14)) for line in lines]
+    hint_surface = render_text_cached(hint_font, "按任意键继续", (198, 198, 198)) if show_hint else None
 
     content_w = 0
     if title_surface is not None:
@@ -282,9 +359,7 @@ def _draw_dialogue_overlay(
     else:
         panel.top = 40
 
-    overlay = pygame.Surface((panel.width, panel.height), pygame.SRCALPHA)
-    overlay.fill((8, 8, 10, 186))
-    surface.blit(overlay, panel.topleft)
+    surface.blit(_filled_overlay(panel.size, (8, 8, 10, 186)), panel.topleft)
     pygame.draw.rect(surface, (206, 206, 206), panel, width=2, border_radius=10)
 
     if speaker_x is not None:
@@ -326,81 +401,97 @@ def _draw_dialogue_overlay(
 
 def _find_object_anchor(map_file: Path) -> tuple[float, float] | None:
     try:
-        with map_file.open("r", encoding="utf-8") as f:
-            content = json.load(f)
+        content = _read_map_json(str(map_file), map_file.stat().st_mtime)
     except Exception:
         return None
 
-    for layer in content.get("layers", []):
-        if str(layer.get("type", "")).strip().lower() != "objectgroup":
+    for obj in _iter_map_objects(content):
+        if int(obj.get("gid", 0)) == 0:
             continue
-        for obj in layer.get("objects", []):
-            gid_raw = int(obj.get("gid", 0))
-            if gid_raw == 0:
-                continue
-            x = float(obj.get("x", 0.0))
-            y = float(obj.get("y", 0.0))
-            width = float(obj.get("width", 0.0))
-            return x + max(0.0, width) * 0.5, y
+        x = float(obj.get("x", 0.0))
+        y = float(obj.get("y", 0.0))
+        width = float(obj.get("width", 0.0))
+        return x + max(0.0, width) * 0.5, y
     return None
 
 
 def _load_dialogue_rows(csv_path: Path, player_name: str) -> list[dict[str, Any]]:
-    if not csv_path.exists():
+    try:
+        mtime = csv_path.stat().st_mtime
+    except OSError:
+        return []
+    return _load_dialogue_rows_cached(str(csv_path), mtime, player_name)
+
+
+# Shared per (path, mtime, player name); callers only read the rows.
+@lru_cache(maxsize=8)
+def _load_dialogue_rows_cached(path_str: str, mtime: float, player_name: str) -> list[dict[str, Any]]:
+    try:
+        data = Path(path_str).read_bytes()
+    except Exception:
         return []
 
-    for encoding in ("utf-8-sig", "utf-8", "gbk", "cp936"):
+    # Decode once and parse once; utf-8-sig also covers BOM-less utf-8.
+    for encoding in ("utf-8-sig", "gbk", "cp936"):
         try:
-            rows: list[dict[str, Any]] = []
-            with csv_path.open("r", encoding=encoding, newline="") as f:
-                reader = csv.DictReader(f)
-                for raw in reader:
-                    text = str(raw.get("text", "")).strip()
-                    if not text:
-                        continue
-
-                    speaker_key = str(raw.get("speaker", "")).strip().lower()
-                    if speaker_key in {"", "player", "玩家"}:
-                        speaker = player_name
-                        speaker_target = "player"
-                    else:
-                        speaker = str(raw.get("speaker", "")).strip()
-                        speaker_target = "npc"
-
-                    raw_position = str(raw.get("position", "")).strip().lower()
-                    if raw_position in {"bottom", "down", "下"}:
-                        position = "bottom"
-                    elif raw_position in {"top", "up", "上"}:
-                        position = "top"
-                    else:
-                        position = "bottom" if speaker_target == "player" else "top"
-
-                    raw_target = str(raw.get("speaker_target", "")).strip().lower()
-                    if raw_target in {"player", "玩家"}:
-                        speaker_target = "player"
-                    elif raw_target in {"npc", "enemy", "对方"}:
-                        speaker_target = "npc"
-
-                    raw_auto_walk = str(raw.get("auto_walk_after", "")).strip().lower()
-                    auto_walk_after = raw_auto_walk in {"1", "true", "yes", "y", "是"}
-                    voice_file = str(raw.get("voice_file", "")).strip()
-
-                    rows.append(
-                        {
-                            "speaker": speaker,
-                            "text": text,
-                            "position": position,
-                            "speaker_target": speaker_target,
-                            "auto_walk_after": auto_walk_after,
-                            "voice_file": voice_file,
-                        }
-                    )
-            return rows
+            content = data.decode(encoding)
+            break
         except UnicodeDecodeError:
             continue
+    else:
+        return []
+
+    rows: list[dict[str, Any]] = []
+    try:
+        # restval="" keeps short rows as strings, so fields need no str() wrapping.
+        for raw in csv.DictReader(io.StringIO(content, newline=""), restval=""):
+            get = raw.get
+            text = get("text", "").strip()
+            if not text:
+                continue
+
+            raw_speaker = get("speaker", "").strip()
+            if raw_speaker.lower() in _PLAYER_SPEAKERS:
+                speaker = player_name
+                speaker_target = "player"
+            else:
+                speaker = raw_speaker
+                speaker_target = "npc"
+
+            position = _DIALOGUE_POSITIONS.get(get("position", "").strip().lower())
+            if position is None:
+                position = "bottom" if speaker_target == "player" else "top"
+            speaker_target = _DIALOGUE_TARGETS.get(get("speaker_target", "").strip().lower(), speaker_target)
+
+            rows.append(
+                {
+                    "speaker": speaker,
+                    "text": text,
+                    "position": position,
+                    "speaker_target": speaker_target,
+                    "auto_walk_after": get("auto_walk_after", "").strip().lower() in _TRUTHY_FLAGS,
+                    "voice_file": get("voice_file", "").strip(),
+                }
+            )
+    except Exception:
+        return []
+    return rows
+
+
+def _preload_dialogue_voices(
+    rows: list[dict[str, Any]],
+    sound_dir: Path,
+    cache: dict[str, pygame.mixer.Sound],
+) -> None:
+    # Decode clips during the map-switch frame so starting a line never waits on disk.
+    for row in rows:
+        voice_file = str(row.get("voice_file") or "").strip()
+        if not voice_file or voice_file in cache:
+            continue
+        try:
+            cache[voice_file] = pygame.mixer.Sound((sound_dir / voice_file).as_posix())
         except Exception:
-            return []
-    return []
+            continue
 
 
 def run_world_scene(
@@ -428,6 +519,12 @@ def run_world_scene(
         print("Check map/assets paths")
         return "quit", screen, display_settings
 
+    # Enter battle by proximity/collision instead of mouse click; compare squared distances.
+    monster_trigger_sq = 0.0
+    if monster_image is not None:
+        trigger_radius = max(monster_image.get_width(), monster_image.get_height()) * 0.42
+        monster_trigger_sq = trigger_radius * trigger_radius
+
     if _show_world_tutorial_prompt(screen, clock) == "quit":
         return "quit", screen, display_settings
     assets_dir = map_dir.parent if map_dir is not None else current_map_file.parent.parent
@@ -448,11 +545,14 @@ def run_world_scene(
     frame_idx = 0
     anim_timer = 0.0
 
-    collision_half_w = max(6, round(run_anim["down"][0].get_width() * core["PLAYER_COLLIDER_WIDTH_RATIO"]))
-    collision_half_h = max(6, round(run_anim["down"][0].get_height() * core["PLAYER_COLLIDER_HEIGHT_RATIO"]))
-    collision_foot_offset = round(run_anim["down"][0].get_height() * core["PLAYER_COLLIDER_FOOT_OFFSET_RATIO"])
-    shadow_w = max(18, round(run_anim["down"][0].get_width() * 0.46))
-    shadow_h = max(10, round(run_anim["down"][0].get_height() * 0.2))
+    player_w, player_h = run_anim["down"][0].get_size()
+    collision_half_w = max(6, round(player_w * core["PLAYER_COLLIDER_WIDTH_RATIO"]))
+    collision_half_h = max(6, round(player_h * core["PLAYER_COLLIDER_HEIGHT_RATIO"]))
+    collision_foot_offset = round(player_h * core["PLAYER_COLLIDER_FOOT_OFFSET_RATIO"])
+    shadow_w = max(18, round(player_w * 0.46))
+    shadow_h = max(10, round(player_h * 0.2))
+    # How far below the NPC anchor the player stops during the map2 cutscene.
+    cutscene_stop_offset = max(106.0, player_h * 0.9)
     player_shadow = pygame.Surface((shadow_w, shadow_h), pygame.SRCALPHA)
     pygame.draw.ellipse(player_shadow, (0, 0, 0, 90), player_shadow.get_rect())
 
@@ -467,6 +567,8 @@ def run_world_scene(
     player_hp = 20
     player_max_hp = 20
     teleport_cooldown = 0.0
+    teleport_miss_list: list[dict[str, Any]] | None = None
+    teleport_miss_foot = (0, 0)
 
     monster_world_x = tiled_map.pixel_width * 0.54
     monster_world_y = tiled_map.pixel_height * 0.32
@@ -474,21 +576,34 @@ def run_world_scene(
 
     cutscene_played_on_second_map = False
     cutscene_state = ""
-    cutscene_target = pygame.Vector2(
-        monster_world_x,
-        monster_world_y + max(108.0, run_anim["down"][0].get_height() * 0.95),
-    )
+    cutscene_target_x = monster_world_x
+    cutscene_target_y = monster_world_y + max(108.0, player_h * 0.95)
     cutscene_npc_world_x = monster_world_x
     cutscene_walk_timeout = 4.2
     dialogue_rows: list[dict[str, Any]] = []
     dialogue_index = 0
     dialogue_typewriter_state = ""
     dialogue_shown_chars = 0.0
+    dialogue_revealed_chars = -1
+    dialogue_revealed_text = ""
     dialogue_char_speed = 22.0
     dialogue_voice_cache: dict[str, pygame.mixer.Sound] = {}
     dialogue_voice_key_played = ""
     dialogue_voice_channel: pygame.mixer.Channel | None = None
     trigger_battle_after_cutscene = False
+    in_second_map = current_map_file.name.lower() == "map2.json"
+    map_scale = core["MAP_RENDER_SCALE"]
+    move_speed = core["MOVE_SPEED"]
+    run_anim_fps = core["ANIM_FPS"]
+    stand_anim_fps = core["STAND_ANIM_FPS"]
+    show_tile_coords = core["SHOW_TILE_COORDS"]
+    show_step_coord = core["SHOW_PLAYER_STEP_COORD"]
+    draw_player_step_coordinate = core["draw_player_step_coordinate"]
+    draw_weather_effects = core["draw_weather_effects"]
+    cached_view_key: tuple[int, int, Any] | None = None
+    world_view_w = world_view_h = 0.0
+    camera_max_x = camera_max_y = 0.0
+    offset_x = offset_y = 0
 
     while True:
         dt = clock.tick(core["FPS"]) / 1000.0
@@ -498,19 +613,23 @@ def run_world_scene(
         open_pause_menu = False
         trigger_battle = False
 
-        world_view_w = view_width / core["MAP_RENDER_SCALE"]
-        world_view_h = view_height / core["MAP_RENDER_SCALE"]
-        camera_x = max(0, min(max(0, tiled_map.pixel_width - world_view_w), x - world_view_w / 2))
-        camera_y = max(0, min(max(0, tiled_map.pixel_height - world_view_h), y - world_view_h / 2))
-        offset_x, offset_y = core["get_map_offset"](
-            tiled_map.pixel_width,
-            tiled_map.pixel_height,
-            view_width,
-            view_height,
-            core["MAP_RENDER_SCALE"],
-        )
-
-        in_second_map = current_map_file.name.lower() == "map2.json"
+        # View extents and map offset only change on resize or map switch.
+        view_key = (view_width, view_height, tiled_map)
+        if view_key != cached_view_key:
+            cached_view_key = view_key
+            world_view_w = view_width / map_scale
+            world_view_h = view_height / map_scale
+            camera_max_x = max(0, tiled_map.pixel_width - world_view_w)
+            camera_max_y = max(0, tiled_map.pixel_height - world_view_h)
+            offset_x, offset_y = core["get_map_offset"](
+                tiled_map.pixel_width,
+                tiled_map.pixel_height,
+                view_width,
+                view_height,
+                map_scale,
+            )
+        camera_x = max(0, min(camera_max_x, x - world_view_w / 2))
+        camera_y = max(0, min(camera_max_y, y - world_view_h / 2))
 
         events = pygame.event.get()
         for event in events:
@@ -532,9 +651,9 @@ def run_world_scene(
             continue
 
         if cutscene_state == "" and monster_alive and monster_image is not None:
-            # Enter battle by proximity/collision instead of mouse click.
-            trigger_radius = max(monster_image.get_width(), monster_image.get_height()) * 0.42
-            trigger_battle = pygame.Vector2(x, y).distance_to((monster_world_x, monster_world_y)) <= trigger_radius
+            to_monster_x = x - monster_world_x
+            to_monster_y = y - monster_world_y
+            trigger_battle = to_monster_x * to_monster_x + to_monster_y * to_monster_y <= monster_trigger_sq
         if cutscene_state == "" and monster_alive and trigger_battle_after_cutscene:
             trigger_battle = True
             trigger_battle_after_cutscene = False
@@ -580,13 +699,14 @@ def run_world_scene(
                 dialogue_text = str(line["text"])
                 dialogue_position = str(line["position"])
                 if str(line["speaker_target"]) == "player":
-                    dialogue_speaker_x = round((x - camera_x) * core["MAP_RENDER_SCALE"] + offset_x)
+                    dialogue_speaker_x = round((x - camera_x) * map_scale + offset_x)
                 else:
-                    dialogue_speaker_x = round((cutscene_npc_world_x - camera_x) * core["MAP_RENDER_SCALE"] + offset_x)
+                    dialogue_speaker_x = round((cutscene_npc_world_x - camera_x) * map_scale + offset_x)
                 typewriter_key = f"{cutscene_state}:{dialogue_index}"
                 if dialogue_typewriter_state != typewriter_key:
                     dialogue_typewriter_state = typewriter_key
                     dialogue_shown_chars = 0.0
+                    dialogue_revealed_chars = -1
                 if dialogue_voice_key_played != typewriter_key:
                     dialogue_voice_key_played = typewriter_key
                     voice_file = str(line.get("voice_file") or "").strip()
@@ -601,9 +721,15 @@ def run_world_scene(
                             dialogue_voice_channel = sound.play()
                         except Exception:
                             pass
-                dialogue_shown_chars = min(float(len(dialogue_text)), dialogue_shown_chars + dialogue_char_speed * dt)
-                dialogue_text_to_draw = dialogue_text[: int(dialogue_shown_chars)]
-                dialogue_fully_revealed = int(dialogue_shown_chars) >= len(dialogue_text)
+                text_len = len(dialogue_text)
+                dialogue_shown_chars = min(float(text_len), dialogue_shown_chars + dialogue_char_speed * dt)
+                revealed_chars = int(dialogue_shown_chars)
+                # The prefix only grows a few times per second; reuse it between reveals.
+                if revealed_chars != dialogue_revealed_chars:
+                    dialogue_revealed_chars = revealed_chars
+                    dialogue_revealed_text = dialogue_text[:revealed_chars]
+                dialogue_text_to_draw = dialogue_revealed_text
+                dialogue_fully_revealed = revealed_chars >= text_len
                 show_dialogue_hint = dialogue_fully_revealed
                 for event in events:
                     if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
@@ -623,18 +749,19 @@ def run_world_scene(
         elif cutscene_state == "auto_walk":
             dialogue_typewriter_state = ""
             dialogue_voice_key_played = ""
-            to_target = pygame.Vector2(cutscene_target.x - x, cutscene_target.y - y)
-            distance = to_target.length()
+            to_target_x = cutscene_target_x - x
+            to_target_y = cutscene_target_y - y
+            distance = math.hypot(to_target_x, to_target_y)
             cutscene_walk_timeout = max(0.0, cutscene_walk_timeout - dt)
             if distance <= 2.0 or cutscene_walk_timeout <= 0.0:
                 if tiled_map.can_move_to(
-                    cutscene_target.x,
-                    cutscene_target.y + collision_foot_offset,
+                    cutscene_target_x,
+                    cutscene_target_y + collision_foot_offset,
                     collision_half_w,
                     collision_half_h,
                 ):
-                    x = cutscene_target.x
-                    y = cutscene_target.y
+                    x = cutscene_target_x
+                    y = cutscene_target_y
                 direction = "up"
                 dialogue_index += 1
                 if dialogue_index >= len(dialogue_rows):
@@ -646,16 +773,16 @@ def run_world_scene(
                     cutscene_state = "line_wait"
             else:
                 moving = True
-                speed = core["MOVE_SPEED"] * 0.92
-                vec = to_target.normalize() * speed * dt
-                move_dx = vec.x
-                move_dy = vec.y
+                speed = move_speed * 0.92
+                move_dx = to_target_x / distance * speed * dt
+                move_dy = to_target_y / distance * speed * dt
         else:
             dialogue_typewriter_state = ""
             dialogue_voice_key_played = ""
             keys = pygame.key.get_pressed()
-            move_dx = float((keys[pygame.K_d] or keys[pygame.K_RIGHT]) - (keys[pygame.K_a] or keys[pygame.K_LEFT]))
-            move_dy = float((keys[pygame.K_s] or keys[pygame.K_DOWN]) - (keys[pygame.K_w] or keys[pygame.K_UP]))
+            # Both sides are bools, so | avoids the short-circuit branches of `or`.
+            move_dx = float((keys[K_d] | keys[K_RIGHT]) - (keys[K_a] | keys[K_LEFT]))
+            move_dy = float((keys[K_s] | keys[K_DOWN]) - (keys[K_w] | keys[K_UP]))
             moving = move_dx != 0.0 or move_dy != 0.0
 
         next_anim = run_anim if moving else stand_anim
@@ -667,22 +794,29 @@ def run_world_scene(
             anim_timer = 0.0
 
         if moving:
-            vec = pygame.Vector2(move_dx, move_dy)
-            vec = vec.normalize() * core["MOVE_SPEED"] * dt
-            target_x = x + vec.x
-            collision_y = y + collision_foot_offset
-            if tiled_map.can_move_to(target_x, collision_y, collision_half_w, collision_half_h):
-                x = target_x
-            target_y = y + vec.y
-            if tiled_map.can_move_to(x, target_y + collision_foot_offset, collision_half_w, collision_half_h):
-                y = target_y
+            # Keyboard input only yields the 8 compass directions; cutscene
+            # walks pass arbitrary vectors and are normalized here.
+            unit = _UNIT_DIRECTIONS.get((move_dx, move_dy))
+            if unit is None:
+                length = math.sqrt(move_dx * move_dx + move_dy * move_dy)
+                unit = (move_dx / length, move_dy / length)
+            step = move_speed * dt
+            x, y = tiled_map.slide_move(
+                x,
+                y,
+                unit[0] * step,
+                unit[1] * step,
+                collision_half_w,
+                collision_half_h,
+                collision_foot_offset,
+            )
 
             if abs(move_dy) > abs(move_dx):
                 direction = "down" if move_dy > 0 else "up"
             else:
                 direction = "right" if move_dx > 0 else "left"
 
-        anim_fps = core["ANIM_FPS"] if moving else core["STAND_ANIM_FPS"]
+        anim_fps = run_anim_fps if moving else stand_anim_fps
         anim_timer += dt
         if anim_timer >= 1.0 / anim_fps:
             anim_timer = 0.0
@@ -697,10 +831,18 @@ def run_world_scene(
         y = max(half_h, min(tiled_map.pixel_height - half_h, y))
 
         map_switched = False
-        if cutscene_state == "" and teleport_cooldown <= 0.0 and teleports:
-            foot_point = (round(x), round(y + collision_foot_offset))
+        foot_x = round(x)
+        foot_y = round(y + collision_foot_offset)
+        # A foot point that already missed every teleport of this map cannot hit one now.
+        if (
+            cutscene_state == ""
+            and teleport_cooldown <= 0.0
+            and teleports
+            and (teleports is not teleport_miss_list or (foot_x, foot_y) != teleport_miss_foot)
+        ):
             for teleport in teleports:
-                if not teleport["rect"].collidepoint(foot_point):
+                left, top, right, bottom = teleport["bounds"]
+                if not (left <= foot_x < right and top <= foot_y < bottom):
                     continue
                 try:
                     target_map_file = _resolve_target_map_file(
@@ -710,6 +852,7 @@ def run_world_scene(
                     )
                     tiled_map = core["TiledMap"](target_map_file)
                     current_map_file = target_map_file
+                    in_second_map = current_map_file.name.lower() == "map2.json"
                     teleports = _load_teleports(current_map_file)
                     x, y = _pick_spawn_position(
                         tiled_map,
@@ -749,18 +892,15 @@ def run_world_scene(
                             cutscene_npc_world_x = anchor[0]
                             monster_world_x = anchor[0]
                             monster_world_y = anchor[1]
-                            cutscene_target = pygame.Vector2(
-                                anchor[0],
-                                anchor[1] + max(106.0, run_anim["down"][0].get_height() * 0.9),
-                            )
+                            cutscene_target_x = anchor[0]
+                            cutscene_target_y = anchor[1] + cutscene_stop_offset
                         else:
                             monster_world_x = tiled_map.pixel_width * 0.54
                             monster_world_y = tiled_map.pixel_height * 0.45
-                            cutscene_target = pygame.Vector2(
-                                monster_world_x,
-                                monster_world_y + max(106.0, run_anim["down"][0].get_height() * 0.9),
-                            )
+                            cutscene_target_x = monster_world_x
+                            cutscene_target_y = monster_world_y + cutscene_stop_offset
                         cutscene_walk_timeout = 5.0
+                        _preload_dialogue_voices(dialogue_rows, sound_dir, dialogue_voice_cache)
                         dialogue_index = 0
                         dialogue_voice_key_played = ""
                         cutscene_state = "line_wait"
@@ -771,26 +911,31 @@ def run_world_scene(
                 except Exception as exc:
                     print(exc)
                 break
+            else:
+                teleport_miss_list = teleports
+                teleport_miss_foot = (foot_x, foot_y)
         if map_switched:
             continue
 
-        screen.fill((0, 0, 0))
-        tiled_map.draw(screen, camera_x, camera_y, core["MAP_RENDER_SCALE"], offset_x, offset_y)
-        if core["SHOW_TILE_COORDS"]:
-            tiled_map.draw_tile_coordinates(screen, camera_x, camera_y, coord_font, core["MAP_RENDER_SCALE"], offset_x, offset_y)
+        # An opaque map that fills the view overdraws the whole frame anyway.
+        if offset_x > 0 or offset_y > 0 or not tiled_map.covers_view(view_width, view_height, map_scale):
+            screen.fill((0, 0, 0))
+        tiled_map.draw(screen, camera_x, camera_y, map_scale, offset_x, offset_y)
+        if show_tile_coords:
+            tiled_map.draw_tile_coordinates(screen, camera_x, camera_y, coord_font, map_scale, offset_x, offset_y)
 
-        if core["SHOW_PLAYER_STEP_COORD"]:
-            core["draw_player_step_coordinate"](screen, coord_font, x, y + collision_foot_offset)
+        if show_step_coord:
+            draw_player_step_coordinate(screen, coord_font, x, y + collision_foot_offset)
 
-        player_center_x = round((x - camera_x) * core["MAP_RENDER_SCALE"] + offset_x)
-        player_center_y = round((y - camera_y) * core["MAP_RENDER_SCALE"] + offset_y)
+        player_center_x = round((x - camera_x) * map_scale + offset_x)
+        player_center_y = round((y - camera_y) * map_scale + offset_y)
         shadow_rect = player_shadow.get_rect(center=(player_center_x, player_center_y + max(8, current.get_height() // 3)))
         screen.blit(player_shadow, shadow_rect)
         player_rect = current.get_rect(center=(player_center_x, player_center_y))
         screen.blit(current, player_rect)
 
-        core["draw_weather_effects"](screen, pygame.time.get_ticks() / 1000.0)
-        hp_label = ui_font.render(f"{player_name} HP {player_hp}/{player_max_hp}", True, (232, 240, 250))
+        draw_weather_effects(screen, pygame.time.get_ticks() / 1000.0)
+        hp_label = render_text_cached(ui_font, f"{player_name} HP {player_hp}/{player_max_hp}", (232, 240, 250))
         screen.blit(hp_label, (18, 54))
         if cutscene_state != "" and dialogue_text:
             _draw_dialogue_overlay(
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+import pygame
+
+
+@lru_cache(maxsize=512)
+def render_text_cached(font: pygame.font.Font, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+    # Shared by menus, the world scene and the battle UI; results are blitted, never drawn on.
+    surface = font.render(text, True, color)
+    return surface.convert_alpha() if pygame.display.get_surface() is not None else surface